@@ -12,6 +12,7 @@ interval variables.
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -33,7 +34,10 @@ class NoOverlapStats:
     room_optional_intervals: int = 0
 
 
-def add_teacher_no_overlap(builder: TimetableModelBuilder) -> int:
+def add_teacher_no_overlap(
+    builder: TimetableModelBuilder,
+    intervals_by_entity: dict[str, list[cp_model.IntervalVar]] | None = None,
+) -> int:
     """
     Add no-overlap constraints for teachers.
 
@@ -42,14 +46,21 @@ def add_teacher_no_overlap(builder: TimetableModelBuilder) -> int:
 
     Args:
         builder: The timetable model builder with created variables
+        intervals_by_entity: Intervals already grouped by teacher_id, if the
+            caller has them; grouped here otherwise
 
     Returns:
         Number of NoOverlap constraints added
     """
     constraints_added = 0
+    intervals_by_teacher = (
+        intervals_by_entity
+        if intervals_by_entity is not None
+        else _group_intervals(builder, "teacher_id")
+    )
 
     for teacher in builder.input.teachers:
-        intervals = _get_teacher_intervals(builder, teacher.id)
+        intervals = intervals_by_teacher.get(teacher.id, [])
 
         if len(intervals) > 1:
             builder.model.AddNoOverlap(intervals)
@@ -58,7 +69,10 @@ def add_teacher_no_overlap(builder: TimetableModelBuilder) -> int:
     return constraints_added
 
 
-def add_class_no_overlap(builder: TimetableModelBuilder) -> int:
+def add_class_no_overlap(
+    builder: TimetableModelBuilder,
+    intervals_by_entity: dict[str, list[cp_model.IntervalVar]] | None = None,
+) -> int:
     """
     Add no-overlap constraints for classes.
 
@@ -67,14 +81,21 @@ def add_class_no_overlap(builder: TimetableModelBuilder) -> int:
 
     Args:
         builder: The timetable model builder with created variables
+        intervals_by_entity: Intervals already grouped by class_id, if the
+            caller has them; grouped here otherwise
 
     Returns:
         Number of NoOverlap constraints added
     """
     constraints_added = 0
+    intervals_by_class = (
+        intervals_by_entity
+        if intervals_by_entity is not None
+        else _group_intervals(builder, "class_id")
+    )
 
     for cls in builder.input.classes:
-        intervals = _get_class_intervals(builder, cls.id)
+        intervals = intervals_by_class.get(cls.id, [])
 
         if len(intervals) > 1:
             builder.model.AddNoOverlap(intervals)
@@ -133,17 +154,19 @@ def add_all_no_overlap_constraints(
     """
     stats = NoOverlapStats()
 
-    # Teacher no-overlap
-    stats.teacher_constraints = add_teacher_no_overlap(builder)
+    # Teacher no-overlap; group once and reuse the buckets for the stats
+    intervals_by_teacher = _group_intervals(builder, "teacher_id")
+    stats.teacher_constraints = add_teacher_no_overlap(builder, intervals_by_teacher)
     stats.teacher_intervals = sum(
-        len(_get_teacher_intervals(builder, t.id))
+        len(intervals_by_teacher.get(t.id, []))
         for t in builder.input.teachers
     )
 
     # Class no-overlap
-    stats.class_constraints = add_class_no_overlap(builder)
+    intervals_by_class = _group_intervals(builder, "class_id")
+    stats.class_constraints = add_class_no_overlap(builder, intervals_by_class)
     stats.class_intervals = sum(
-        len(_get_class_intervals(builder, c.id))
+        len(intervals_by_class.get(c.id, []))
         for c in builder.input.classes
     )
 
@@ -158,52 +181,30 @@ def add_all_no_overlap_constraints(
 # Helper Functions
 # =============================================================================
 
-def _get_teacher_intervals(
+def _group_intervals(
     builder: TimetableModelBuilder,
-    teacher_id: str
-) -> list[cp_model.IntervalVar]:
-    """
-    Get all interval variables for lessons taught by a specific teacher.
-
-    Args:
-        builder: The model builder
-        teacher_id: ID of the teacher
-
-    Returns:
-        List of IntervalVar for all lesson instances of this teacher
+    key: str
+) -> dict[str, list[cp_model.IntervalVar]]:
     """
-    intervals = []
-
-    for lesson in builder.input.lessons:
-        if lesson.teacher_id == teacher_id:
-            for inst in builder.lesson_vars.get(lesson.id, []):
-                intervals.append(inst.interval_var)
-
-    return intervals
+    Group all lesson interval variables by a lesson attribute in one pass.
 
-
-def _get_class_intervals(
-    builder: TimetableModelBuilder,
-    class_id: str
-) -> list[cp_model.IntervalVar]:
-    """
-    Get all interval variables for lessons of a specific class.
+    Scanning the lessons once per teacher or class is quadratic in school
+    size; grouping up front keeps constraint posting linear.
 
     Args:
         builder: The model builder
-        class_id: ID of the class
+        key: Lesson attribute to group by ("teacher_id" or "class_id")
 
     Returns:
-        List of IntervalVar for all lesson instances of this class
+        Mapping of attribute value to the IntervalVars of its lesson instances
     """
-    intervals = []
+    grouped: dict[str, list[cp_model.IntervalVar]] = defaultdict(list)
 
     for lesson in builder.input.lessons:
-        if lesson.class_id == class_id:
-            for inst in builder.lesson_vars.get(lesson.id, []):
-                intervals.append(inst.interval_var)
+        for inst in builder.lesson_vars.get(lesson.id, []):
+            grouped[getattr(lesson, key)].append(inst.interval_var)
 
-    return intervals
+    return grouped
 
 
 def _is_room_valid_for_lesson(
@@ -68,8 +68,6 @@ def get_valid_rooms_for_lesson(
     Returns:
         List of valid room indices
     """
-    valid_indices = []
-
     # Get class size for capacity check
     student_class = builder.input.get_class(lesson.class_id)
     class_size = student_class.student_count if student_class else None
@@ -77,14 +75,17 @@ def get_valid_rooms_for_lesson(
     # Get subject for room type requirement
     subject = builder.input.get_subject(lesson.subject_id)
 
-    for idx, room in enumerate(builder.input.rooms):
-        suitability = _evaluate_room_suitability(
-            room, idx, lesson, class_size, subject, builder
-        )
-        if suitability.is_valid:
-            valid_indices.append(idx)
+    # Resolve the lesson's requirements once rather than per room
+    required_type = _get_required_room_type(lesson, subject)
+    min_capacity = _get_min_capacity(lesson, class_size)
 
-    return valid_indices
+    return [
+        idx
+        for idx, room in enumerate(builder.input.rooms)
+        if _room_rejection_reason(
+            room, lesson.room_requirement, required_type, min_capacity
+        ) is None
+    ]
 
 
 def _evaluate_room_suitability(
@@ -115,47 +116,54 @@ def _evaluate_room_suitability(
         is_valid=True
     )
 
-    req = lesson.room_requirement
+    reason = _room_rejection_reason(
+        room,
+        lesson.room_requirement,
+        _get_required_room_type(lesson, subject),
+        _get_min_capacity(lesson, class_size),
+    )
+    if reason is not None:
+        result.is_valid = False
+        result.reasons.append(reason)
+
+    return result
+
+
+def _room_rejection_reason(
+    room: Room,
+    req: RoomRequirement | None,
+    required_type: str | None,
+    min_capacity: int | None,
+) -> str | None:
+    """
+    Check a room against a lesson's resolved requirements.
 
+    Returns:
+        Why the room is unsuitable, or None if it fits
+    """
     # Check excluded rooms
     if req and room.id in req.excluded_rooms:
-        result.is_valid = False
-        result.reasons.append(f"Room {room.id} is excluded for this lesson")
-        return result
+        return f"Room {room.id} is excluded for this lesson"
 
-    # Check specific room requirement
-    if req and req.preferred_rooms:
-        # If specific rooms are required, only those are valid
-        if room.id not in req.preferred_rooms:
-            result.is_valid = False
-            result.reasons.append(f"Lesson requires specific rooms: {req.preferred_rooms}")
-            return result
+    # If specific rooms are required, only those are valid
+    if req and req.preferred_rooms and room.id not in req.preferred_rooms:
+        return f"Lesson requires specific rooms: {req.preferred_rooms}"
 
     # Check room type requirement
-    required_type = _get_required_room_type(lesson, subject)
     if required_type and room.type != required_type:
-        result.is_valid = False
-        result.reasons.append(f"Requires room type {required_type}, got {room.type}")
-        return result
+        return f"Requires room type {required_type}, got {room.type}"
 
     # Check capacity requirement
-    min_capacity = _get_min_capacity(lesson, class_size)
     if min_capacity and room.capacity and room.capacity < min_capacity:
-        result.is_valid = False
-        result.reasons.append(f"Room capacity {room.capacity} < required {min_capacity}")
-        return result
+        return f"Room capacity {room.capacity} < required {min_capacity}"
 
     # Check equipment requirements
     if req and req.requires_equipment:
-        room_equipment = set(room.equipment or [])
-        required_equipment = set(req.requires_equipment)
-        missing = required_equipment - room_equipment
+        missing = set(req.requires_equipment).difference(room.equipment or ())
         if missing:
-            result.is_valid = False
-            result.reasons.append(f"Missing equipment: {missing}")
-            return result
+            return f"Missing equipment: {missing}"
 
-    return result
+    return None
 
 
 def _get_required_room_type(lesson: Lesson, subject) -> str | None:
@@ -28,8 +28,9 @@ def load_school_data(path: Union[str, Path]) -> dict:
     """
     path = Path(path)
 
-    with open(path) as f:
-        data = json.load(f)
+    # Parse the raw bytes: json detects UTF-8/16/32 itself, which skips the
+    # text-mode decode layer and does not depend on the locale's encoding.
+    data = json.loads(path.read_bytes())
 
     validate_school_data(data)
     return data
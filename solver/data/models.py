@@ -15,7 +15,9 @@ Example times:
 
 from __future__ import annotations
 
+import re
 from enum import Enum
+from functools import lru_cache
 from typing import Annotated, Any, Optional
 
 from pydantic import (
@@ -76,10 +78,12 @@ def time_to_minutes(time_str: str) -> int:
     return h * 60 + m
 
 
+_WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday")
+
+
 def day_name(day: int) -> str:
     """Get day name from index."""
-    names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-    return names[day] if 0 <= day <= 4 else f"Day {day}"
+    return _WEEKDAY_NAMES[day] if 0 <= day <= 4 else f"Day {day}"
 
 
 # =============================================================================
@@ -720,18 +724,22 @@ def load_timetable_from_json(path: str) -> TimetableInput:
     return TimetableInput.model_validate(converted_data)
 
 
-def _convert_keys_to_snake_case(obj: Any) -> Any:
-    """Recursively convert dictionary keys from camelCase to snake_case."""
-    import re
+_ACRONYM_BOUNDARY = re.compile(r'([A-Z]+)([A-Z][a-z])')
+_CAMEL_BOUNDARY = re.compile(r'([a-z\d])([A-Z])')
 
-    def to_snake_case(name: str) -> str:
-        # Handle common patterns
-        name = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', name)
-        name = re.sub(r'([a-z\d])([A-Z])', r'\1_\2', name)
-        return name.lower()
 
+@lru_cache(maxsize=None)
+def _to_snake_case(name: str) -> str:
+    """Convert a camelCase key to snake_case (keys repeat, so memoized)."""
+    name = _ACRONYM_BOUNDARY.sub(r'\1_\2', name)
+    name = _CAMEL_BOUNDARY.sub(r'\1_\2', name)
+    return name.lower()
+
+
+def _convert_keys_to_snake_case(obj: Any) -> Any:
+    """Recursively convert dictionary keys from camelCase to snake_case."""
     if isinstance(obj, dict):
-        return {to_snake_case(k): _convert_keys_to_snake_case(v) for k, v in obj.items()}
+        return {_to_snake_case(k): _convert_keys_to_snake_case(v) for k, v in obj.items()}
     elif isinstance(obj, list):
         return [_convert_keys_to_snake_case(item) for item in obj]
     else:
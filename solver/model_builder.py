@@ -39,6 +39,7 @@ from .data.models import (
 
 MINUTES_PER_DAY = 1440
 MINUTES_PER_HOUR = 60
+SHORT_DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
 
 
 # =============================================================================
@@ -106,8 +107,7 @@ def day_minutes_to_week_minutes(day: int, day_minutes: int) -> int:
 def format_week_time(week_minutes: int) -> str:
     """Format week minutes as 'DayName HH:MM'."""
     day, hour, minute = minutes_to_week_time(week_minutes)
-    day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    day_name = day_names[day] if day < len(day_names) else f"Day{day}"
+    day_name = SHORT_DAY_NAMES[day] if day < len(SHORT_DAY_NAMES) else f"Day{day}"
     return f"{day_name} {hour:02d}:{minute:02d}"
 
 
@@ -123,7 +123,7 @@ class LessonInstanceVars:
 
     # Time variables
     start_var: cp_model.IntVar  # Start time in week minutes
-    end_var: cp_model.IntVar    # End time in week minutes
+    end_var: cp_model.LinearExpr  # End time in week minutes (start + duration)
     duration: int               # Fixed duration in minutes
 
     # Interval variable for no-overlap constraints
@@ -157,6 +157,16 @@ class SolverStatus(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
+# CP-SAT status codes mapped to SolverStatus
+CP_STATUS_MAP: dict[int, SolverStatus] = {
+    cp_model.OPTIMAL: SolverStatus.OPTIMAL,
+    cp_model.FEASIBLE: SolverStatus.FEASIBLE,
+    cp_model.INFEASIBLE: SolverStatus.INFEASIBLE,
+    cp_model.MODEL_INVALID: SolverStatus.MODEL_INVALID,
+    cp_model.UNKNOWN: SolverStatus.UNKNOWN,
+}
+
+
 @dataclass
 class LessonAssignment:
     """A single lesson assignment in the solution."""
@@ -297,20 +307,14 @@ class TimetableModelBuilder:
                 f"{var_prefix}_start"
             )
 
-            # End time variable
-            end_var = self.model.NewIntVar(
-                duration, self.week_minutes,
-                f"{var_prefix}_end"
-            )
-
-            # End = Start + Duration
-            self.model.Add(end_var == start_var + duration)
-
-            # Interval variable for no-overlap constraints
-            interval_var = self.model.NewIntervalVar(
-                start_var, duration, end_var,
+            # Interval variable for no-overlap constraints. The duration is
+            # fixed, so the end is the affine expression start + duration
+            # rather than a separate variable.
+            interval_var = self.model.NewFixedSizeIntervalVar(
+                start_var, duration,
                 f"{var_prefix}_interval"
             )
+            end_var = start_var + duration
 
             # Day variable (derived from start time)
             day_var = self.model.NewIntVar(0, self.num_days - 1, f"{var_prefix}_day")
@@ -401,31 +405,31 @@ class TimetableModelBuilder:
 
         Lessons must start and end within schedulable periods.
         """
-        schedulable_periods = self.input.get_schedulable_periods()
+        # Convert each period to week minutes once, not per lesson instance
+        period_bounds = [
+            (
+                day_minutes_to_week_minutes(period.day, period.start_minutes),
+                day_minutes_to_week_minutes(period.day, period.end_minutes),
+            )
+            for period in self.input.get_schedulable_periods()
+        ]
+        # Allowed starts depend only on duration, so build each domain once
+        allowed_starts_by_duration: dict[int, cp_model.Domain] = {}
 
         for lesson_id, instances in self.lesson_vars.items():
             for inst in instances:
-                # Build allowed (start, end) pairs for this lesson
-                allowed_starts = []
-
-                for period in schedulable_periods:
-                    day = period.day
-                    week_start = day_minutes_to_week_minutes(day, period.start_minutes)
-                    week_end = day_minutes_to_week_minutes(day, period.end_minutes)
-
-                    # Check if lesson fits in this period
-                    if week_end - week_start >= inst.duration:
-                        allowed_starts.append(week_start)
-
-                # Constrain start to allowed values
-                if allowed_starts:
-                    self.model.AddAllowedAssignments(
-                        [inst.start_var],
-                        [[s] for s in allowed_starts]
-                    )
-                else:
-                    # No valid slots - this will make model infeasible
-                    self.model.Add(inst.start_var == -1)  # Impossible
+                allowed_starts = allowed_starts_by_duration.get(inst.duration)
+                if allowed_starts is None:
+                    # Periods long enough to hold this lesson
+                    allowed_starts = cp_model.Domain.FromValues([
+                        week_start for week_start, week_end in period_bounds
+                        if week_end - week_start >= inst.duration
+                    ])
+                    allowed_starts_by_duration[inst.duration] = allowed_starts
+
+                # Constrain start to allowed values; an empty domain makes
+                # the model infeasible when no period can hold the lesson
+                self.model.AddLinearExpressionInDomain(inst.start_var, allowed_starts)
 
     def _add_teacher_no_overlap_constraint(self) -> None:
         """Teachers cannot teach two lessons at the same time."""
@@ -692,12 +696,50 @@ class TimetableModelBuilder:
     # Solving
     # -------------------------------------------------------------------------
 
-    def solve(self, time_limit_seconds: int = 60) -> SolverSolution:
+    def add_solution_hint(self, solution: SolverSolution) -> int:
+        """
+        Warm-start the search from a previous solution of the same input.
+
+        Hints each matching lesson instance's start, day and room, replacing
+        any earlier hint. CP-SAT repairs or ignores hints that no longer fit,
+        so a stale solution is safe to pass.
+
+        Args:
+            solution: An earlier solution, e.g. before a small input edit
+
+        Returns:
+            Number of lesson instances hinted
+        """
+        if not self._variables_created:
+            self.create_variables()
+
+        self.model.ClearHints()
+        hinted = 0
+        for a in solution.assignments:
+            instances = self.lesson_vars.get(a.lesson_id)
+            room_idx = self._room_indices.get(a.room_id)
+            if not instances or a.instance >= len(instances) or room_idx is None:
+                continue
+
+            inst = instances[a.instance]
+            self.model.AddHint(inst.start_var, day_minutes_to_week_minutes(a.day, a.start_minutes))
+            self.model.AddHint(inst.day_var, a.day)
+            self.model.AddHint(inst.room_var, room_idx)
+            hinted += 1
+
+        return hinted
+
+    def solve(
+        self,
+        time_limit_seconds: int = 60,
+        num_search_workers: int = 0,
+    ) -> SolverSolution:
         """
         Solve the timetabling problem.
 
         Args:
             time_limit_seconds: Maximum time to spend solving
+            num_search_workers: CP-SAT search workers (0 = all available cores)
 
         Returns:
             SolverSolution with status and assignments
@@ -712,22 +754,14 @@ class TimetableModelBuilder:
         # Configure solver
         solver = cp_model.CpSolver()
         solver.parameters.max_time_in_seconds = time_limit_seconds
-        solver.parameters.num_search_workers = 0  # Use all available cores
+        solver.parameters.num_search_workers = num_search_workers
         solver.parameters.linearization_level = 2  # Maximum LP relaxation for better bounds
         solver.parameters.log_search_progress = False
 
         # Solve
         status_code = solver.Solve(self.model)
 
-        # Map status
-        status_map = {
-            cp_model.OPTIMAL: SolverStatus.OPTIMAL,
-            cp_model.FEASIBLE: SolverStatus.FEASIBLE,
-            cp_model.INFEASIBLE: SolverStatus.INFEASIBLE,
-            cp_model.MODEL_INVALID: SolverStatus.MODEL_INVALID,
-            cp_model.UNKNOWN: SolverStatus.UNKNOWN,
-        }
-        status = status_map.get(status_code, SolverStatus.UNKNOWN)
+        status = CP_STATUS_MAP.get(status_code, SolverStatus.UNKNOWN)
 
         # Extract solution if feasible
         assignments: list[LessonAssignment] = []
@@ -7,6 +7,8 @@ converts them to the structured TimetableOutput format.
 
 from __future__ import annotations
 
+from itertools import groupby
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
 from ortools.sat.python import cp_model
@@ -36,7 +38,16 @@ if TYPE_CHECKING:
 # =============================================================================
 
 MINUTES_PER_DAY = 1440
-DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# CP-SAT status name -> output status
+_STATUS_BY_NAME: dict[str, OutputStatus] = {
+    "OPTIMAL": OutputStatus.OPTIMAL,
+    "FEASIBLE": OutputStatus.FEASIBLE,
+    "INFEASIBLE": OutputStatus.INFEASIBLE,
+    "MODEL_INVALID": OutputStatus.UNKNOWN,
+    "UNKNOWN": OutputStatus.TIMEOUT,
+}
 
 
 # =============================================================================
@@ -89,9 +100,7 @@ def group_by_teacher(lessons: list[LessonOutput]) -> dict[str, list[LessonOutput
     """Group lessons by teacher ID."""
     result: dict[str, list[LessonOutput]] = {}
     for lesson in lessons:
-        if lesson.teacher_id not in result:
-            result[lesson.teacher_id] = []
-        result[lesson.teacher_id].append(lesson)
+        result.setdefault(lesson.teacher_id, []).append(lesson)
     return result
 
 
@@ -99,9 +108,7 @@ def group_by_class(lessons: list[LessonOutput]) -> dict[str, list[LessonOutput]]
     """Group lessons by class ID."""
     result: dict[str, list[LessonOutput]] = {}
     for lesson in lessons:
-        if lesson.class_id not in result:
-            result[lesson.class_id] = []
-        result[lesson.class_id].append(lesson)
+        result.setdefault(lesson.class_id, []).append(lesson)
     return result
 
 
@@ -109,9 +116,7 @@ def group_by_room(lessons: list[LessonOutput]) -> dict[str, list[LessonOutput]]:
     """Group lessons by room ID."""
     result: dict[str, list[LessonOutput]] = {}
     for lesson in lessons:
-        if lesson.room_id not in result:
-            result[lesson.room_id] = []
-        result[lesson.room_id].append(lesson)
+        result.setdefault(lesson.room_id, []).append(lesson)
     return result
 
 
@@ -119,9 +124,7 @@ def group_by_day(lessons: list[LessonOutput]) -> dict[int, list[LessonOutput]]:
     """Group lessons by day index."""
     result: dict[int, list[LessonOutput]] = {}
     for lesson in lessons:
-        if lesson.day not in result:
-            result[lesson.day] = []
-        result[lesson.day].append(lesson)
+        result.setdefault(lesson.day, []).append(lesson)
     return result
 
 
@@ -236,16 +239,7 @@ class SolutionExtractor:
                 return OutputStatus.UNKNOWN
 
         status_name = solver.StatusName(solver_status)
-
-        status_map = {
-            "OPTIMAL": OutputStatus.OPTIMAL,
-            "FEASIBLE": OutputStatus.FEASIBLE,
-            "INFEASIBLE": OutputStatus.INFEASIBLE,
-            "MODEL_INVALID": OutputStatus.UNKNOWN,
-            "UNKNOWN": OutputStatus.TIMEOUT,
-        }
-
-        return status_map.get(status_name, OutputStatus.UNKNOWN)
+        return _STATUS_BY_NAME.get(status_name, OutputStatus.UNKNOWN)
 
     def _create_empty_output(
         self,
@@ -397,7 +391,7 @@ class SolutionExtractor:
         lessons: list[LessonOutput],
         input_data: TimetableInput,
     ) -> TimetableViews:
-        """Create pre-computed views from lessons."""
+        """Create pre-computed views from lessons (containers skip re-validation)."""
         # Group lessons
         by_teacher = group_by_teacher(lessons)
         by_class = group_by_class(lessons)
@@ -413,33 +407,33 @@ class SolutionExtractor:
         teacher_schedules = {}
         for teacher_id, teacher_lessons in by_teacher.items():
             sorted_lessons = sort_lessons(teacher_lessons)
-            teacher_schedules[teacher_id] = EntitySchedule(
+            teacher_schedules[teacher_id] = EntitySchedule.model_construct(
                 id=teacher_id,
                 name=teacher_names.get(teacher_id, teacher_id),
                 lessons=sorted_lessons,
-                byDay=self._group_entity_by_day(sorted_lessons),
+                by_day=self._group_entity_by_day(sorted_lessons),
             )
 
         # Create class schedules
         class_schedules = {}
         for class_id, class_lessons in by_class.items():
             sorted_lessons = sort_lessons(class_lessons)
-            class_schedules[class_id] = EntitySchedule(
+            class_schedules[class_id] = EntitySchedule.model_construct(
                 id=class_id,
                 name=class_names.get(class_id, class_id),
                 lessons=sorted_lessons,
-                byDay=self._group_entity_by_day(sorted_lessons),
+                by_day=self._group_entity_by_day(sorted_lessons),
             )
 
         # Create room schedules
         room_schedules = {}
         for room_id, room_lessons in by_room.items():
             sorted_lessons = sort_lessons(room_lessons)
-            room_schedules[room_id] = EntitySchedule(
+            room_schedules[room_id] = EntitySchedule.model_construct(
                 id=room_id,
                 name=room_names.get(room_id, room_id),
                 lessons=sorted_lessons,
-                byDay=self._group_entity_by_day(sorted_lessons),
+                by_day=self._group_entity_by_day(sorted_lessons),
             )
 
         # Create day schedules
@@ -447,30 +441,25 @@ class SolutionExtractor:
         for day, day_lessons in by_day.items():
             sorted_lessons = sort_lessons(day_lessons)
             day_name = DAY_NAMES[day] if day < len(DAY_NAMES) else f"Day {day}"
-            day_schedules[day] = DaySchedule(
+            day_schedules[day] = DaySchedule.model_construct(
                 day=day,
-                dayName=day_name,
+                day_name=day_name,
                 lessons=sorted_lessons,
             )
 
-        return TimetableViews(
-            byTeacher=teacher_schedules,
-            byClass=class_schedules,
-            byRoom=room_schedules,
-            byDay=day_schedules,
+        return TimetableViews.model_construct(
+            by_teacher=teacher_schedules,
+            by_class=class_schedules,
+            by_room=room_schedules,
+            by_day=day_schedules,
         )
 
     def _group_entity_by_day(
         self,
         lessons: list[LessonOutput],
     ) -> dict[int, list[LessonOutput]]:
-        """Group an entity's lessons by day."""
-        result: dict[int, list[LessonOutput]] = {}
-        for lesson in lessons:
-            if lesson.day not in result:
-                result[lesson.day] = []
-            result[lesson.day].append(lesson)
-        return result
+        """Group an entity's lessons, already sorted by day, by day."""
+        return {day: list(group) for day, group in groupby(lessons, key=attrgetter("day"))}
 
 
 # =============================================================================
@@ -76,10 +76,7 @@ class JSONFormatter:
 
     def format_lessons_only(self, output: TimetableOutput) -> str:
         """Format only the lessons array as JSON."""
-        lessons_data = [
-            lesson.model_dump(by_alias=True)
-            for lesson in output.timetable.lessons
-        ]
+        lessons_data = [lesson.to_dict() for lesson in output.timetable.lessons]
         return json.dumps(lessons_data, indent=self.indent, ensure_ascii=self.ensure_ascii)
 
 
@@ -31,6 +31,9 @@ DEFAULT_TARGETS = {
     "utilization": 70.0,          # Min utilization percentage
 }
 
+# Letter grades, best first (see QualityMetricsCalculator._score_to_grade)
+GRADES = ("A", "B", "C", "D", "F")
+
 
 # =============================================================================
 # Data Classes
@@ -45,6 +48,10 @@ class GapMetrics:
     teacher_days_analyzed: int
     gaps_by_teacher: dict[str, float] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        if self.average_gap_minutes < 0:
+            raise ValueError(f"average_gap_minutes must be >= 0, got {self.average_gap_minutes}")
+
     @property
     def score(self) -> float:
         """Lower is better. Returns 100 - normalized gap."""
@@ -61,6 +68,13 @@ class DistributionMetrics:
     percentage_well_distributed: float
     poorly_distributed: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        if not 0 <= self.percentage_well_distributed <= 100:
+            raise ValueError(
+                f"percentage_well_distributed must be in [0, 100], "
+                f"got {self.percentage_well_distributed}"
+            )
+
     @property
     def score(self) -> float:
         """Higher is better. Returns percentage."""
@@ -75,6 +89,10 @@ class BalanceMetrics:
     teacher_balance: dict[str, float] = field(default_factory=dict)
     unbalanced_teachers: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        if self.average_std_dev < 0:
+            raise ValueError(f"average_std_dev must be >= 0, got {self.average_std_dev}")
+
     @property
     def score(self) -> float:
         """Lower std dev is better. Returns 100 - normalized deviation."""
@@ -118,6 +136,12 @@ class MetricsReport:
     # Improvement suggestions
     improvement_areas: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        if not 0 <= self.overall_score <= 100:
+            raise ValueError(f"overall_score must be in [0, 100], got {self.overall_score}")
+        if self.grade not in GRADES:
+            raise ValueError(f"grade must be one of {GRADES}, got {self.grade!r}")
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
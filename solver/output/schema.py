@@ -7,13 +7,24 @@ including pre-computed views for convenient access by different dimensions.
 
 from __future__ import annotations
 
-from datetime import time
+from collections import defaultdict
+from itertools import groupby
+from operator import attrgetter
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
-from solver.model_builder import SolverSolution, SolverStatus, LessonAssignment
+from solver.model_builder import (
+    MINUTES_PER_DAY,
+    SolverSolution,
+    SolverStatus,
+    LessonAssignment,
+)
+
+
+# Output models are emitted once per solve and only read afterwards
+_OUTPUT_MODEL_CONFIG = ConfigDict(populate_by_name=True, frozen=True)
 
 
 # =============================================================================
@@ -53,7 +64,8 @@ class LessonOutput(BaseModel):
     period_id: Optional[str] = Field(default=None, alias="periodId")
     period_name: Optional[str] = Field(default=None, alias="periodName")
 
-    model_config = {"populate_by_name": True}
+    # Frozen: one instance is shared by the timetable and every view
+    model_config = _OUTPUT_MODEL_CONFIG
 
     @classmethod
     def from_assignment(cls, assignment: LessonAssignment) -> LessonOutput:
@@ -76,6 +88,31 @@ class LessonOutput(BaseModel):
             periodName=assignment.period_name,
         )
 
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize to a camelCase dictionary.
+
+        Equivalent to model_dump(by_alias=True) for this flat model, but built
+        directly, which is about twice as fast when dumping lessons one by one.
+        """
+        return {
+            "lessonId": self.lesson_id,
+            "instance": self.instance,
+            "day": self.day,
+            "startTime": self.start_time,
+            "endTime": self.end_time,
+            "roomId": self.room_id,
+            "teacherId": self.teacher_id,
+            "classId": self.class_id,
+            "subjectId": self.subject_id,
+            "roomName": self.room_name,
+            "teacherName": self.teacher_name,
+            "className": self.class_name,
+            "subjectName": self.subject_name,
+            "periodId": self.period_id,
+            "periodName": self.period_name,
+        }
+
 
 # =============================================================================
 # Quality Metrics
@@ -90,7 +127,7 @@ class QualityMetrics(BaseModel):
         alias="softConstraintScores"
     )
 
-    model_config = {"populate_by_name": True}
+    model_config = _OUTPUT_MODEL_CONFIG
 
 
 # =============================================================================
@@ -103,7 +140,7 @@ class DaySchedule(BaseModel):
     day_name: str = Field(alias="dayName")
     lessons: list[LessonOutput]
 
-    model_config = {"populate_by_name": True}
+    model_config = _OUTPUT_MODEL_CONFIG
 
 
 class EntitySchedule(BaseModel):
@@ -116,7 +153,7 @@ class EntitySchedule(BaseModel):
         alias="byDay"
     )
 
-    model_config = {"populate_by_name": True}
+    model_config = _OUTPUT_MODEL_CONFIG
 
 
 class TimetableViews(BaseModel):
@@ -138,7 +175,7 @@ class TimetableViews(BaseModel):
         alias="byDay"
     )
 
-    model_config = {"populate_by_name": True}
+    model_config = _OUTPUT_MODEL_CONFIG
 
 
 # =============================================================================
@@ -149,7 +186,7 @@ class Timetable(BaseModel):
     """The core timetable data."""
     lessons: list[LessonOutput]
 
-    model_config = {"populate_by_name": True}
+    model_config = _OUTPUT_MODEL_CONFIG
 
 
 # =============================================================================
@@ -164,7 +201,7 @@ class TimetableOutput(BaseModel):
     timetable: Timetable
     views: TimetableViews
 
-    model_config = {"populate_by_name": True}
+    model_config = _OUTPUT_MODEL_CONFIG
 
     def to_json(self, indent: int = 2) -> str:
         """Serialize to JSON string."""
@@ -179,26 +216,34 @@ class TimetableOutput(BaseModel):
 # Conversion Functions
 # =============================================================================
 
+# Every minute of the day (and midnight as an end time) preformatted once
+_TIME_STRS = tuple(f"{m // 60:02d}:{m % 60:02d}" for m in range(MINUTES_PER_DAY + 1))
+
+
 def _minutes_to_time_str(minutes: int) -> str:
     """Convert minutes from midnight to 'HH:MM' string."""
+    if 0 <= minutes <= MINUTES_PER_DAY:
+        return _TIME_STRS[minutes]
     hours = minutes // 60
     mins = minutes % 60
     return f"{hours:02d}:{mins:02d}"
 
 
+_STATUS_MAP: dict[SolverStatus, OutputStatus] = {
+    SolverStatus.OPTIMAL: OutputStatus.OPTIMAL,
+    SolverStatus.FEASIBLE: OutputStatus.FEASIBLE,
+    SolverStatus.INFEASIBLE: OutputStatus.INFEASIBLE,
+    SolverStatus.UNKNOWN: OutputStatus.TIMEOUT,
+    SolverStatus.MODEL_INVALID: OutputStatus.UNKNOWN,
+}
+
+
 def _status_to_output(status: SolverStatus) -> OutputStatus:
     """Convert SolverStatus to OutputStatus."""
-    mapping = {
-        SolverStatus.OPTIMAL: OutputStatus.OPTIMAL,
-        SolverStatus.FEASIBLE: OutputStatus.FEASIBLE,
-        SolverStatus.INFEASIBLE: OutputStatus.INFEASIBLE,
-        SolverStatus.UNKNOWN: OutputStatus.TIMEOUT,
-        SolverStatus.MODEL_INVALID: OutputStatus.UNKNOWN,
-    }
-    return mapping.get(status, OutputStatus.UNKNOWN)
+    return _STATUS_MAP.get(status, OutputStatus.UNKNOWN)
 
 
-DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
 
 
 def create_timetable_output(
@@ -254,101 +299,80 @@ def _create_views(
     class_names: dict[str, str],
     room_names: dict[str, str],
 ) -> TimetableViews:
-    """Create pre-computed views from lessons."""
-    # Group lessons by different dimensions
-    by_teacher: dict[str, list[LessonOutput]] = {}
-    by_class: dict[str, list[LessonOutput]] = {}
-    by_room: dict[str, list[LessonOutput]] = {}
-    by_day: dict[int, list[LessonOutput]] = {}
-
-    for lesson in lessons:
-        # By teacher
-        if lesson.teacher_id not in by_teacher:
-            by_teacher[lesson.teacher_id] = []
-        by_teacher[lesson.teacher_id].append(lesson)
+    """
+    Create pre-computed views from lessons.
 
-        # By class
-        if lesson.class_id not in by_class:
-            by_class[lesson.class_id] = []
+    The view containers are built with model_construct: their contents are
+    LessonOutputs that were validated on creation, so re-validating every
+    nested list would only copy it.
+    """
+    # Group lessons by every dimension in a single pass
+    by_teacher: dict[str, list[LessonOutput]] = defaultdict(list)
+    by_class: dict[str, list[LessonOutput]] = defaultdict(list)
+    by_room: dict[str, list[LessonOutput]] = defaultdict(list)
+    by_day: dict[int, list[LessonOutput]] = defaultdict(list)
+
+    # Sorting once up front leaves every bucket in (day, start) order
+    for lesson in sorted(lessons, key=lambda l: (l.day, l.start_time)):
+        by_teacher[lesson.teacher_id].append(lesson)
         by_class[lesson.class_id].append(lesson)
-
-        # By room
-        if lesson.room_id not in by_room:
-            by_room[lesson.room_id] = []
         by_room[lesson.room_id].append(lesson)
-
-        # By day
-        if lesson.day not in by_day:
-            by_day[lesson.day] = []
         by_day[lesson.day].append(lesson)
 
-    # Sort lessons within each group by day then start time
-    def sort_lessons(lesson_list: list[LessonOutput]) -> list[LessonOutput]:
-        return sorted(lesson_list, key=lambda l: (l.day, l.start_time))
-
     # Create EntitySchedule for teachers
     teacher_schedules = {}
     for teacher_id, teacher_lessons in by_teacher.items():
-        sorted_lessons = sort_lessons(teacher_lessons)
-        teacher_by_day = _group_by_day(sorted_lessons)
-        teacher_schedules[teacher_id] = EntitySchedule(
+        teacher_by_day = _group_by_day(teacher_lessons)
+        teacher_schedules[teacher_id] = EntitySchedule.model_construct(
             id=teacher_id,
             name=teacher_names.get(teacher_id) or teacher_lessons[0].teacher_name or teacher_id,
-            lessons=sorted_lessons,
-            byDay=teacher_by_day,
+            lessons=teacher_lessons,
+            by_day=teacher_by_day,
         )
 
     # Create EntitySchedule for classes
     class_schedules = {}
     for class_id, class_lessons in by_class.items():
-        sorted_lessons = sort_lessons(class_lessons)
-        class_by_day = _group_by_day(sorted_lessons)
-        class_schedules[class_id] = EntitySchedule(
+        class_by_day = _group_by_day(class_lessons)
+        class_schedules[class_id] = EntitySchedule.model_construct(
             id=class_id,
             name=class_names.get(class_id) or class_lessons[0].class_name or class_id,
-            lessons=sorted_lessons,
-            byDay=class_by_day,
+            lessons=class_lessons,
+            by_day=class_by_day,
         )
 
     # Create EntitySchedule for rooms
     room_schedules = {}
     for room_id, room_lessons in by_room.items():
-        sorted_lessons = sort_lessons(room_lessons)
-        room_by_day = _group_by_day(sorted_lessons)
-        room_schedules[room_id] = EntitySchedule(
+        room_by_day = _group_by_day(room_lessons)
+        room_schedules[room_id] = EntitySchedule.model_construct(
             id=room_id,
             name=room_names.get(room_id) or room_lessons[0].room_name or room_id,
-            lessons=sorted_lessons,
-            byDay=room_by_day,
+            lessons=room_lessons,
+            by_day=room_by_day,
         )
 
     # Create DaySchedule for each day
     day_schedules = {}
     for day, day_lessons in by_day.items():
-        sorted_lessons = sort_lessons(day_lessons)
         day_name = DAY_NAMES[day] if day < len(DAY_NAMES) else f"Day {day}"
-        day_schedules[day] = DaySchedule(
+        day_schedules[day] = DaySchedule.model_construct(
             day=day,
-            dayName=day_name,
-            lessons=sorted_lessons,
+            day_name=day_name,
+            lessons=day_lessons,
         )
 
-    return TimetableViews(
-        byTeacher=teacher_schedules,
-        byClass=class_schedules,
-        byRoom=room_schedules,
-        byDay=day_schedules,
+    return TimetableViews.model_construct(
+        by_teacher=teacher_schedules,
+        by_class=class_schedules,
+        by_room=room_schedules,
+        by_day=day_schedules,
     )
 
 
 def _group_by_day(lessons: list[LessonOutput]) -> dict[int, list[LessonOutput]]:
-    """Group lessons by day."""
-    by_day: dict[int, list[LessonOutput]] = {}
-    for lesson in lessons:
-        if lesson.day not in by_day:
-            by_day[lesson.day] = []
-        by_day[lesson.day].append(lesson)
-    return by_day
+    """Group lessons, already sorted by day, into consecutive per-day runs."""
+    return {day: list(group) for day, group in groupby(lessons, key=attrgetter("day"))}
 
 
 # =============================================================================
@@ -0,0 +1,104 @@
+"""Plain input builders and assertion helpers shared by the test modules."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from operator import attrgetter
+
+from solver.data.models import (
+    TimetableInput,
+    SchoolConfig,
+    Teacher,
+    StudentClass,
+    Subject,
+    Room,
+    Lesson,
+    Period,
+    RoomType,
+)
+from solver.model_builder import LessonAssignment
+
+
+_DAY_PREFIXES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+
+def period_grid(days: int, per_day: int) -> list[Period]:
+    """Back-to-back one-hour periods mon1.. from 09:00 on the first `days` weekdays."""
+    return [
+        Period(
+            id=f"{_DAY_PREFIXES[d]}{p + 1}",
+            name=f"{_DAY_PREFIXES[d].title()} P{p + 1}",
+            day=d,
+            start_minutes=540 + 60 * p,
+            end_minutes=600 + 60 * p,
+        )
+        for d in range(days)
+        for p in range(per_day)
+    ]
+
+
+def make_lesson(**overrides) -> Lesson:
+    """One weekly maths lesson l1 for t1/c1, with fields overridden as given."""
+    fields = dict(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=1)
+    fields.update(overrides)
+    return Lesson(**fields)
+
+
+def make_input(
+    lessons: list[Lesson] | None = None,
+    *,
+    teachers: int | list[Teacher] = 1,
+    classes: int | list[StudentClass] = 1,
+    rooms: int | list[Room] = 1,
+    subjects: list[Subject] | None = None,
+    periods: list[Period] | None = None,
+    num_days: int = 5,
+) -> TimetableInput:
+    """
+    Build a small TimetableInput around `lessons` (default: one make_lesson()).
+
+    Counts expand to plain teachers t1.., classes c1.. and classrooms r1..;
+    pass lists where a test needs specific entities. Subjects default to
+    maths and English, periods to the single slot period_grid(1, 1).
+    """
+    if isinstance(teachers, int):
+        teachers = [Teacher(id=f"t{i}", name=f"Teacher {i}") for i in range(1, teachers + 1)]
+    if isinstance(classes, int):
+        classes = [StudentClass(id=f"c{i}", name=f"Class {i}") for i in range(1, classes + 1)]
+    if isinstance(rooms, int):
+        rooms = [
+            Room(id=f"r{i}", name=f"Room {i}", type=RoomType.CLASSROOM)
+            for i in range(1, rooms + 1)
+        ]
+    return TimetableInput(
+        config=SchoolConfig(num_days=num_days),
+        teachers=teachers,
+        classes=classes,
+        subjects=subjects or [Subject(id="mat", name="Maths"), Subject(id="eng", name="English")],
+        rooms=rooms,
+        lessons=lessons if lessons is not None else [make_lesson()],
+        periods=periods if periods is not None else period_grid(1, 1),
+    )
+
+
+def assert_no_double_booking(
+    assignments: list[LessonAssignment], key: str, label: str
+) -> None:
+    """
+    Assert that no two assignments sharing `key` overlap in time.
+
+    Each group is sorted by (day, start) once, so only neighbours need
+    comparing: if any later lesson overlaps, the next one does too.
+    """
+    groups: dict[str, list[LessonAssignment]] = defaultdict(list)
+    for a in assignments:
+        groups[getattr(a, key)].append(a)
+
+    for entity_id, group in groups.items():
+        group.sort(key=attrgetter("day", "start_minutes"))
+        for a1, a2 in zip(group, group[1:]):
+            assert not (a1.day == a2.day and a2.start_minutes < a1.end_minutes), (
+                f"{label} {entity_id} double-booked: "
+                f"Day {a1.day}, {a1.start_minutes}-{a1.end_minutes} and "
+                f"{a2.start_minutes}-{a2.end_minutes}"
+            )
@@ -0,0 +1,14 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import TypeAdapter
+
+from solver.data.models import TimetableInput
+
+
+@pytest.fixture(scope="session")
+def tt_adapter() -> TypeAdapter[TimetableInput]:
+    """TimetableInput validator, built once per test session."""
+    return TypeAdapter(TimetableInput)
@@ -330,8 +330,11 @@ class TestInfeasibleScenarios:
             subjects=[Subject(id="mat", name="Maths")],
             rooms=[Room(id="r1", name="Room 1", type=RoomType.CLASSROOM)],
             lessons=[
-                # Needs 3 slots but only 2 available
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=3),
+                # 90-minute lessons, but every period is only 60 minutes long
+                Lesson(
+                    id="l1", teacher_id="t1", class_id="c1", subject_id="mat",
+                    duration_minutes=90, lessons_per_week=2,
+                ),
             ],
             periods=[
                 Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
@@ -352,8 +355,17 @@ class TestInfeasibleScenarios:
 
     def test_infeasible_teacher_overloaded(self):
         """Infeasible when teacher has too many lessons for available slots."""
+        # Input validation rejects more lessons than periods outright, so the
+        # teacher is instead unavailable for one of the three periods
         input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
+            teachers=[
+                Teacher(
+                    id="t1", name="Teacher 1",
+                    availability=[
+                        Availability(day=1, start_minutes=540, end_minutes=600, available=False),
+                    ],
+                ),
+            ],
             classes=[
                 StudentClass(id="c1", name="Class 1"),
                 StudentClass(id="c2", name="Class 2"),
@@ -361,9 +373,9 @@ class TestInfeasibleScenarios:
             subjects=[Subject(id="mat", name="Maths")],
             rooms=[Room(id="r1", name="Room 1", type=RoomType.CLASSROOM)],
             lessons=[
-                # 3 lessons but only 2 slots for same teacher
+                # 3 lessons but only 2 slots the teacher can use
                 Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=2),
-                Lesson(id="l2", teacher_id="t1", class_id="c2", subject_id="mat", lessons_per_week=2),
+                Lesson(id="l2", teacher_id="t1", class_id="c2", subject_id="mat", lessons_per_week=1),
             ],
             periods=[
                 Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
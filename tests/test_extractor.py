@@ -274,13 +274,15 @@ class TestSolutionExtractor:
 
         # Create an infeasible scenario
         input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
+            teachers=[Teacher(id="t1", name="Teacher 1"), Teacher(id="t2", name="Teacher 2")],
             classes=[StudentClass(id="c1", name="Class 1")],
             subjects=[Subject(id="mat", name="Maths")],
             rooms=[Room(id="r1", name="Room 1", type=RoomType.CLASSROOM)],
             lessons=[
-                # 3 lessons but only 2 slots
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=3),
+                # 3 lessons for one class but only 2 slots; each teacher fits,
+                # so input validation lets it through to the solver
+                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=2),
+                Lesson(id="l2", teacher_id="t2", class_id="c1", subject_id="mat", lessons_per_week=1),
             ],
             periods=[
                 Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
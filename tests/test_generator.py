@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -23,6 +24,44 @@ from solver.data.models import (
 )
 
 
+@pytest.fixture(scope="session")
+def sample_school():
+    """Default sample school, generated once per test session."""
+    return generate_sample_school(GeneratorConfig(seed=42))
+
+
+@pytest.fixture(scope="session")
+def sample_school_index(sample_school):
+    """Derived lookups over sample_school, computed once and shared."""
+    return SimpleNamespace(
+        year_groups={c.year_group for c in sample_school.classes},
+        days={p.day for p in sample_school.periods},
+        teachers_by_id={t.id: t for t in sample_school.teachers},
+        classes_by_id={c.id: c for c in sample_school.classes},
+        subjects_by_id={s.id: s for s in sample_school.subjects},
+        rooms_by_id={r.id: r for r in sample_school.rooms},
+    )
+
+
+@pytest.fixture(scope="session")
+def large_school():
+    """Large school, generated once per test session."""
+    return generate_large_school(seed=42)
+
+
+@pytest.fixture(scope="session")
+def saved_school(tmp_path_factory):
+    """Small school saved once, with the written file parsed once."""
+    school = generate_small_school(seed=42)
+    filepath = tmp_path_factory.mktemp("saved") / "test_school.json"
+    save_generated_school(school, str(filepath))
+
+    with open(filepath) as f:
+        data = json.load(f)
+
+    return SimpleNamespace(school=school, filepath=filepath, data=data)
+
+
 class TestGeneratorConfig:
     """Tests for GeneratorConfig."""
 
@@ -99,13 +138,9 @@ class TestGenerateSampleSchool:
 
         assert len(school.classes) == 8
 
-    def test_classes_have_year_groups(self):
+    def test_classes_have_year_groups(self, sample_school_index):
         """Classes are distributed across year groups."""
-        config = GeneratorConfig(num_classes=10, year_groups=[7, 8, 9, 10], seed=42)
-        school = generate_sample_school(config)
-
-        year_groups = set(c.year_group for c in school.classes)
-        assert len(year_groups) > 1  # Multiple year groups represented
+        assert len(sample_school_index.year_groups) > 1  # Multiple year groups represented
 
     def test_generates_rooms(self):
         """Generates correct number of rooms."""
@@ -135,21 +170,15 @@ class TestGenerateSampleSchool:
         class_ids_with_lessons = set(l.class_id for l in school.lessons)
         assert len(class_ids_with_lessons) == len(school.classes)
 
-    def test_lessons_reference_valid_teachers(self):
+    def test_lessons_reference_valid_teachers(self, sample_school, sample_school_index):
         """All lessons reference existing teachers."""
-        school = generate_sample_school(GeneratorConfig(seed=42))
+        for lesson in sample_school.lessons:
+            assert lesson.teacher_id in sample_school_index.teachers_by_id
 
-        teacher_ids = set(t.id for t in school.teachers)
-        for lesson in school.lessons:
-            assert lesson.teacher_id in teacher_ids
-
-    def test_lessons_reference_valid_subjects(self):
+    def test_lessons_reference_valid_subjects(self, sample_school, sample_school_index):
         """All lessons reference existing subjects."""
-        school = generate_sample_school(GeneratorConfig(seed=42))
-
-        subject_ids = set(s.id for s in school.subjects)
-        for lesson in school.lessons:
-            assert lesson.subject_id in subject_ids
+        for lesson in sample_school.lessons:
+            assert lesson.subject_id in sample_school_index.subjects_by_id
 
     def test_generates_periods(self):
         """Generates period structure."""
@@ -158,13 +187,9 @@ class TestGenerateSampleSchool:
 
         assert len(school.periods) == 5 * 6
 
-    def test_periods_cover_all_days(self):
+    def test_periods_cover_all_days(self, sample_school_index):
         """Periods exist for all days."""
-        config = GeneratorConfig(num_days=5, seed=42)
-        school = generate_sample_school(config)
-
-        days = set(p.day for p in school.periods)
-        assert days == {0, 1, 2, 3, 4}
+        assert sample_school_index.days == {0, 1, 2, 3, 4}
 
     def test_school_config_set(self):
         """School config is properly set."""
@@ -223,25 +248,19 @@ class TestGenerateMediumSchool:
 class TestGenerateLargeSchool:
     """Tests for generate_large_school function."""
 
-    def test_generates_large_school(self):
+    def test_generates_large_school(self, large_school):
         """Generates a large school for stress testing."""
-        school = generate_large_school(seed=42)
+        assert len(large_school.teachers) == 80
+        assert len(large_school.classes) == 60
+        assert len(large_school.rooms) >= 60  # Updated for feasibility
 
-        assert len(school.teachers) == 80
-        assert len(school.classes) == 60
-        assert len(school.rooms) >= 60  # Updated for feasibility
-
-    def test_large_school_is_valid(self):
+    def test_large_school_is_valid(self, large_school):
         """Large school passes validation."""
-        school = generate_large_school(seed=42)
-
-        assert isinstance(school, TimetableInput)
+        assert isinstance(large_school, TimetableInput)
 
-    def test_large_school_has_many_lessons(self):
+    def test_large_school_has_many_lessons(self, large_school):
         """Large school has many lesson instances."""
-        school = generate_large_school(seed=42)
-
-        total_instances = sum(l.lessons_per_week for l in school.lessons)
+        total_instances = sum(l.lessons_per_week for l in large_school.lessons)
         # Should be 1000+ for stress testing
         assert total_instances > 1000
 
@@ -249,40 +268,25 @@ class TestGenerateLargeSchool:
 class TestSaveGeneratedSchool:
     """Tests for save_generated_school function."""
 
-    def test_saves_valid_json(self):
+    def test_saves_valid_json(self, saved_school):
         """Saves valid JSON file."""
-        school = generate_small_school(seed=42)
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "test_school.json"
-            save_generated_school(school, str(filepath))
-
-            assert filepath.exists()
+        assert saved_school.filepath.exists()
 
-            with open(filepath) as f:
-                data = json.load(f)
+        data = saved_school.data
+        assert "teachers" in data
+        assert "classes" in data
+        assert "subjects" in data
+        assert "rooms" in data
+        assert "lessons" in data
+        assert "periods" in data
 
-            assert "teachers" in data
-            assert "classes" in data
-            assert "subjects" in data
-            assert "rooms" in data
-            assert "lessons" in data
-            assert "periods" in data
-
-    def test_saved_file_has_correct_counts(self):
+    def test_saved_file_has_correct_counts(self, saved_school):
         """Saved file has correct entity counts."""
-        school = generate_small_school(seed=42)
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "test_school.json"
-            save_generated_school(school, str(filepath))
-
-            with open(filepath) as f:
-                data = json.load(f)
+        school, data = saved_school.school, saved_school.data
 
-            assert len(data["teachers"]) == len(school.teachers)
-            assert len(data["classes"]) == len(school.classes)
-            assert len(data["rooms"]) == len(school.rooms)
+        assert len(data["teachers"]) == len(school.teachers)
+        assert len(data["classes"]) == len(school.classes)
+        assert len(data["rooms"]) == len(school.rooms)
 
     def test_creates_parent_directories(self):
         """Creates parent directories if needed."""
@@ -331,59 +335,47 @@ class TestGetGenerationStats:
         assert 0 <= stats["utilization_percent"] <= 100
 
 
-class TestDataRealism:
-    """Tests for realistic data generation."""
+# (id, check) pairs evaluated against the shared sample school; each check
+# returns the offending entities, so an empty list means the check passed
+REALISM_CHECKS = [
+    # Names should have first and last name
+    ("teacher_names", lambda s: [t.name for t in s.teachers if len(t.name.split()) < 2]),
+    ("subject_colors", lambda s: [
+        (sub.id, sub.color) for sub in s.subjects
+        if not (sub.color and sub.color.startswith("#"))
+    ]),
+    ("class_names", lambda s: [c.name for c in s.classes if "Year" not in c.name]),
+    ("room_capacity", lambda s: [
+        (r.id, r.capacity) for r in s.rooms if r.capacity is None or r.capacity <= 0
+    ]),
+]
 
-    def test_teacher_names_are_realistic(self):
-        """Teacher names look realistic."""
-        school = generate_sample_school(GeneratorConfig(num_teachers=10, seed=42))
 
-        for teacher in school.teachers:
-            # Name should have first and last name
-            parts = teacher.name.split()
-            assert len(parts) >= 2
-
-    def test_subjects_have_colors(self):
-        """Subjects have color codes."""
-        school = generate_sample_school(GeneratorConfig(seed=42))
+class TestDataRealism:
+    """Tests for realistic data generation."""
 
-        for subject in school.subjects:
-            assert subject.color is not None
-            assert subject.color.startswith("#")
+    @pytest.mark.parametrize(
+        "name,check", REALISM_CHECKS, ids=[name for name, _ in REALISM_CHECKS]
+    )
+    def test_realism(self, sample_school, name, check):
+        """Generated entities look realistic."""
+        offenders = check(sample_school)
+        assert not offenders, f"{name}: {offenders}"
 
-    def test_science_requires_lab(self):
+    def test_science_requires_lab(self, sample_school_index):
         """Science subject requires science lab."""
-        school = generate_sample_school(GeneratorConfig(seed=42))
-
-        science = next((s for s in school.subjects if s.id == "sci"), None)
+        science = sample_school_index.subjects_by_id.get("sci")
         if science:
             assert science.requires_specialist_room
             assert science.required_room_type == RoomType.SCIENCE_LAB
 
-    def test_pe_requires_gym(self):
+    def test_pe_requires_gym(self, sample_school_index):
         """PE subject requires gym."""
-        school = generate_sample_school(GeneratorConfig(include_specialist_subjects=True, seed=42))
-
-        pe = next((s for s in school.subjects if s.id == "pe"), None)
+        pe = sample_school_index.subjects_by_id.get("pe")
         if pe:
             assert pe.requires_specialist_room
             assert pe.required_room_type == RoomType.GYM
 
-    def test_class_names_follow_pattern(self):
-        """Class names follow Year X pattern."""
-        school = generate_sample_school(GeneratorConfig(seed=42))
-
-        for cls in school.classes:
-            assert "Year" in cls.name
-
-    def test_rooms_have_capacity(self):
-        """All rooms have capacity set."""
-        school = generate_sample_school(GeneratorConfig(seed=42))
-
-        for room in school.rooms:
-            assert room.capacity is not None
-            assert room.capacity > 0
-
 
 class TestEdgeCases:
     """Tests for edge cases."""
@@ -428,11 +420,16 @@ class TestEdgeCases:
 
     def test_different_seeds_produce_different_data(self):
         """Different seeds produce different data."""
-        config1 = GeneratorConfig(num_teachers=5, seed=1)
-        config2 = GeneratorConfig(num_teachers=5, seed=2)
-
-        school1 = generate_sample_school(config1)
-        school2 = generate_sample_school(config2)
+        # Only teacher names are compared, so keep the rest of the school tiny
+        cfg = dict(
+            num_teachers=5,
+            num_classes=2,
+            num_rooms=2,
+            include_specialist_subjects=False,
+            lessons_per_class_per_week=1,
+        )
+        school1 = generate_sample_school(GeneratorConfig(seed=1, **cfg))
+        school2 = generate_sample_school(GeneratorConfig(seed=2, **cfg))
 
         # Names should be different with different seeds
         names1 = [t.name for t in school1.teachers]
@@ -1,5 +1,6 @@
 """Tests for data loading and validation."""
 
+import copy
 import pytest
 import json
 import tempfile
@@ -8,9 +9,9 @@ from pathlib import Path
 from solver.data.loader import load_school_data, validate_school_data, DataValidationError
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def valid_data():
-    """Minimal valid school data."""
+    """Minimal valid school data (shared; deep-copy before mutating)."""
     return {
         "teachers": [{"id": "t1", "name": "Teacher 1"}],
         "rooms": [{"id": "r1", "name": "Room 1"}],
@@ -22,6 +23,22 @@ def valid_data():
     }
 
 
+def _drop_teachers(data):
+    del data["teachers"]
+
+
+def _unknown_lesson_teacher(data):
+    data["lessons"][0]["teacher_id"] = "nonexistent"
+
+
+def _unknown_availability_teacher(data):
+    data["teacher_availability"] = {"nonexistent": [{"day": 0, "period": 1}]}
+
+
+def _duplicate_lesson(data):
+    data["lessons"].append(dict(data["lessons"][0]))
+
+
 class TestValidation:
     """Tests for data validation."""
 
@@ -29,33 +46,27 @@ class TestValidation:
         """Valid data should pass validation without errors."""
         validate_school_data(valid_data)  # Should not raise
 
-    def test_missing_required_field(self, valid_data):
-        """Missing required fields should raise an error."""
-        del valid_data["teachers"]
-        with pytest.raises(DataValidationError, match="Missing required field: teachers"):
-            validate_school_data(valid_data)
-
-    def test_invalid_teacher_reference(self, valid_data):
-        """Invalid teacher reference should raise an error."""
-        valid_data["lessons"][0]["teacher_id"] = "nonexistent"
-        with pytest.raises(DataValidationError, match="unknown teacher"):
-            validate_school_data(valid_data)
-
-    def test_invalid_room_reference_in_availability(self, valid_data):
-        """Invalid teacher in availability should raise an error."""
-        valid_data["teacher_availability"] = {
-            "nonexistent": [{"day": 0, "period": 1}]
-        }
-        with pytest.raises(DataValidationError, match="unknown teacher"):
-            validate_school_data(valid_data)
-
-    def test_duplicate_lesson_ids(self, valid_data):
-        """Duplicate lesson IDs should raise an error."""
-        valid_data["lessons"].append(
-            {"id": "l1", "teacher_id": "t1", "group_id": "g1", "subject_id": "s1"}
-        )
-        with pytest.raises(DataValidationError, match="Duplicate lesson ID"):
-            validate_school_data(valid_data)
+    @pytest.mark.parametrize(
+        "mutate,error",
+        [
+            (_drop_teachers, "Missing required field: teachers"),
+            (_unknown_lesson_teacher, "unknown teacher"),
+            (_unknown_availability_teacher, "unknown teacher"),
+            (_duplicate_lesson, "Duplicate lesson ID"),
+        ],
+        ids=[
+            "missing_required_field",
+            "invalid_teacher_reference",
+            "invalid_teacher_in_availability",
+            "duplicate_lesson_ids",
+        ],
+    )
+    def test_invalid_data_raises(self, valid_data, mutate, error):
+        """Invalid data should raise a descriptive error."""
+        data = copy.deepcopy(valid_data)
+        mutate(data)
+        with pytest.raises(DataValidationError, match=error):
+            validate_school_data(data)
 
 
 class TestFileLoading:
@@ -71,6 +82,17 @@ class TestFileLoading:
         assert loaded["teachers"] == valid_data["teachers"]
         assert loaded["lessons"] == valid_data["lessons"]
 
+    def test_load_non_ascii_utf8_file(self, valid_data, tmp_path):
+        """UTF-8 files load regardless of the platform's default encoding."""
+        data = copy.deepcopy(valid_data)
+        data["teachers"][0]["name"] = "Mme Lefèvre"
+        filepath = tmp_path / "school.json"
+        filepath.write_bytes(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+        loaded = load_school_data(filepath)
+
+        assert loaded["teachers"][0]["name"] == "Mme Lefèvre"
+
     def test_load_nonexistent_file(self):
         """Should raise FileNotFoundError for missing files."""
         with pytest.raises(FileNotFoundError):
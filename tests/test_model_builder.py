@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import pytest
+from pydantic import ValidationError
 
 from solver.model_builder import (
     TimetableModelBuilder,
@@ -25,6 +26,11 @@ from solver.data.models import (
     RoomType,
     SchoolConfig,
 )
+from tests._factories import assert_no_double_booking, make_input, make_lesson, period_grid
+
+
+# These models solve in milliseconds; a short limit makes regressions fail fast.
+SOLVE_LIMIT = 2
 
 
 class TestTimeConversions:
@@ -51,7 +57,8 @@ class TestTimeConversions:
         assert week_time_to_minutes(4, 16, 0) == 5760 + 960
 
     def test_roundtrip(self):
-        for minutes in [0, 570, 1440, 1980, 5760, 7199]:
+        # Every minute of a five-day week
+        for minutes in range(5 * MINUTES_PER_DAY):
             day, hour, minute = minutes_to_week_time(minutes)
             assert week_time_to_minutes(day, hour, minute) == minutes
 
@@ -66,9 +73,9 @@ class TestTimeConversions:
         assert format_week_time(5760 + 960) == "Fri 16:00"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def minimal_input() -> TimetableInput:
-    """Minimal valid timetable input for testing."""
+    """Minimal valid timetable input for testing (shared; do not mutate)."""
     return TimetableInput(
         config=SchoolConfig(school_name="Test School", num_days=5),
         teachers=[
@@ -92,31 +99,24 @@ def minimal_input() -> TimetableInput:
             Lesson(id="l2", teacher_id="t2", class_id="c1", subject_id="s2", lessons_per_week=2),
             Lesson(id="l3", teacher_id="t1", class_id="c2", subject_id="s1", lessons_per_week=3),
         ],
-        periods=[
-            # Monday periods
-            Period(id="mon1", name="Period 1", day=0, start_minutes=540, end_minutes=600),
-            Period(id="mon2", name="Period 2", day=0, start_minutes=600, end_minutes=660),
-            Period(id="mon3", name="Period 3", day=0, start_minutes=680, end_minutes=740),
-            # Tuesday periods
-            Period(id="tue1", name="Period 1", day=1, start_minutes=540, end_minutes=600),
-            Period(id="tue2", name="Period 2", day=1, start_minutes=600, end_minutes=660),
-            Period(id="tue3", name="Period 3", day=1, start_minutes=680, end_minutes=740),
-            # Wednesday periods
-            Period(id="wed1", name="Period 1", day=2, start_minutes=540, end_minutes=600),
-            Period(id="wed2", name="Period 2", day=2, start_minutes=600, end_minutes=660),
-            Period(id="wed3", name="Period 3", day=2, start_minutes=680, end_minutes=740),
-            # Thursday periods
-            Period(id="thu1", name="Period 1", day=3, start_minutes=540, end_minutes=600),
-            Period(id="thu2", name="Period 2", day=3, start_minutes=600, end_minutes=660),
-            Period(id="thu3", name="Period 3", day=3, start_minutes=680, end_minutes=740),
-            # Friday periods
-            Period(id="fri1", name="Period 1", day=4, start_minutes=540, end_minutes=600),
-            Period(id="fri2", name="Period 2", day=4, start_minutes=600, end_minutes=660),
-            Period(id="fri3", name="Period 3", day=4, start_minutes=680, end_minutes=740),
-        ],
+        periods=period_grid(5, 3),  # mon1..fri3
     )
 
 
+@pytest.fixture(scope="module")
+def built_builder(minimal_input) -> TimetableModelBuilder:
+    """Builder over minimal_input with variables created once per module."""
+    builder = TimetableModelBuilder(minimal_input)
+    builder.create_variables()
+    return builder
+
+
+@pytest.fixture
+def mutable_input(minimal_input) -> TimetableInput:
+    """Deep copy of minimal_input for tests that modify it."""
+    return minimal_input.model_copy(deep=True)
+
+
 class TestModelBuilder:
     """Tests for TimetableModelBuilder."""
 
@@ -129,10 +129,9 @@ class TestModelBuilder:
         assert not builder._variables_created
         assert not builder._constraints_added
 
-    def test_create_variables(self, minimal_input):
+    def test_create_variables(self, built_builder):
         """Test variable creation."""
-        builder = TimetableModelBuilder(minimal_input)
-        builder.create_variables()
+        builder = built_builder
 
         # Should have variables for each lesson
         assert len(builder.lesson_vars) == 3
@@ -150,10 +149,9 @@ class TestModelBuilder:
         assert l1_inst0.instance == 0
         assert l1_inst0.duration == 60  # default
 
-    def test_get_statistics(self, minimal_input):
+    def test_get_statistics(self, built_builder):
         """Test statistics gathering."""
-        builder = TimetableModelBuilder(minimal_input)
-        builder.create_variables()
+        builder = built_builder
 
         stats = builder.get_statistics()
 
@@ -164,10 +162,9 @@ class TestModelBuilder:
         assert stats["num_periods"] == 15
         assert stats["variables_created"] is True
 
-    def test_get_teacher_intervals(self, minimal_input):
+    def test_get_teacher_intervals(self, built_builder):
         """Test getting intervals for a teacher."""
-        builder = TimetableModelBuilder(minimal_input)
-        builder.create_variables()
+        builder = built_builder
 
         # Teacher t1 teaches l1 (3 instances) and l3 (3 instances)
         t1_intervals = builder.get_teacher_intervals("t1")
@@ -177,10 +174,9 @@ class TestModelBuilder:
         t2_intervals = builder.get_teacher_intervals("t2")
         assert len(t2_intervals) == 2
 
-    def test_get_class_intervals(self, minimal_input):
+    def test_get_class_intervals(self, built_builder):
         """Test getting intervals for a class."""
-        builder = TimetableModelBuilder(minimal_input)
-        builder.create_variables()
+        builder = built_builder
 
         # Class c1 has l1 (3) and l2 (2) = 5 instances
         c1_intervals = builder.get_class_intervals("c1")
@@ -190,23 +186,44 @@ class TestModelBuilder:
         c2_intervals = builder.get_class_intervals("c2")
         assert len(c2_intervals) == 3
 
+    @pytest.mark.slow
     def test_solve_simple(self, minimal_input):
         """Test solving a simple problem."""
         builder = TimetableModelBuilder(minimal_input)
-        solution = builder.solve(time_limit_seconds=30)
+        solution = builder.solve(time_limit_seconds=SOLVE_LIMIT, num_search_workers=1)
 
         assert solution.is_feasible
         assert len(solution.assignments) == 8  # All lesson instances assigned
 
-    def test_solve_with_teacher_availability(self, minimal_input):
+    @pytest.mark.slow
+    def test_solution_hint(self, minimal_input):
+        """A previous solution warm-starts a fresh builder over the same input."""
+        first = TimetableModelBuilder(minimal_input).solve(
+            time_limit_seconds=SOLVE_LIMIT, num_search_workers=1
+        )
+        assert first.is_feasible
+
+        builder = TimetableModelBuilder(minimal_input)
+        assert builder.add_solution_hint(first) == 8
+        # A second hint replaces the first rather than duplicating it:
+        # 3 hinted variables for each of the 8 instances
+        assert builder.add_solution_hint(first) == 8
+        assert len(builder.model.Proto().solution_hint.vars) == 24
+
+        solution = builder.solve(time_limit_seconds=SOLVE_LIMIT, num_search_workers=1)
+        assert solution.is_feasible
+        assert len(solution.assignments) == 8
+
+    @pytest.mark.slow
+    def test_solve_with_teacher_availability(self, mutable_input):
         """Test solving with teacher availability constraints."""
         # Make teacher t1 unavailable Monday morning
-        minimal_input.teachers[0].availability = [
+        mutable_input.teachers[0].availability = [
             Availability(day=0, start_minutes=540, end_minutes=660, available=False)
         ]
 
-        builder = TimetableModelBuilder(minimal_input)
-        solution = builder.solve(time_limit_seconds=30)
+        builder = TimetableModelBuilder(mutable_input)
+        solution = builder.solve(time_limit_seconds=SOLVE_LIMIT, num_search_workers=1)
 
         assert solution.is_feasible
 
@@ -214,10 +231,11 @@ class TestModelBuilder:
         for assignment in solution.assignments:
             if assignment.teacher_id == "t1":
                 if assignment.day == 0:
-                    assert assignment.start_minutes >= 680, \
+                    assert assignment.start_minutes >= 660, \
                         "Teacher t1 should not be scheduled during unavailable time"
 
 
+@pytest.mark.slow
 class TestRoomConstraints:
     """Tests for room-related constraints."""
 
@@ -248,7 +266,7 @@ class TestRoomConstraints:
         )
 
         builder = TimetableModelBuilder(input_data)
-        solution = builder.solve(time_limit_seconds=30)
+        solution = builder.solve(time_limit_seconds=SOLVE_LIMIT, num_search_workers=1)
 
         assert solution.is_feasible
 
@@ -258,163 +276,111 @@ class TestRoomConstraints:
                 "Science lessons should be in science lab"
 
 
-class TestNoOverlap:
-    """Tests for no-overlap constraints."""
-
-    def test_teacher_no_overlap(self):
-        """Test that same teacher can't be double-booked."""
-        input_data = TimetableInput(
-            config=SchoolConfig(school_name="Test", num_days=1),
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[
-                StudentClass(id="c1", name="Class 1"),
-                StudentClass(id="c2", name="Class 2"),
-            ],
-            subjects=[Subject(id="s1", name="Subject 1")],
-            rooms=[
-                Room(id="r1", name="Room 1", type=RoomType.CLASSROOM),
-                Room(id="r2", name="Room 2", type=RoomType.CLASSROOM),
-            ],
-            lessons=[
-                # Same teacher teaches two different classes
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="s1", lessons_per_week=1),
-                Lesson(id="l2", teacher_id="t1", class_id="c2", subject_id="s1", lessons_per_week=1),
-            ],
-            periods=[
-                Period(id="p1", name="P1", day=0, start_minutes=540, end_minutes=600),
-                Period(id="p2", name="P2", day=0, start_minutes=600, end_minutes=660),
-            ],
-        )
+def _teacher_overlap_input() -> TimetableInput:
+    """One teacher taking two classes in a two-period day."""
+    return make_input(
+        [make_lesson(), make_lesson(id="l2", class_id="c2")],
+        classes=2,
+        rooms=2,
+        periods=period_grid(1, 2),
+        num_days=1,
+    )
 
-        builder = TimetableModelBuilder(input_data)
-        solution = builder.solve(time_limit_seconds=30)
 
-        assert solution.is_feasible
+def _class_overlap_input() -> TimetableInput:
+    """One class with two teachers in a two-period day."""
+    return make_input(
+        [make_lesson(), make_lesson(id="l2", teacher_id="t2", subject_id="eng")],
+        teachers=2,
+        rooms=2,
+        periods=period_grid(1, 2),
+        num_days=1,
+    )
 
-        # Lessons should be at different times
-        times = [(a.day, a.start_minutes) for a in solution.assignments]
-        assert len(set(times)) == 2, "Teacher's lessons should be at different times"
 
-    def test_class_no_overlap(self):
-        """Test that same class can't have two lessons at same time."""
-        input_data = TimetableInput(
-            config=SchoolConfig(school_name="Test", num_days=1),
-            teachers=[
-                Teacher(id="t1", name="Teacher 1"),
-                Teacher(id="t2", name="Teacher 2"),
-            ],
-            classes=[StudentClass(id="c1", name="Class 1")],
-            subjects=[
-                Subject(id="s1", name="Subject 1"),
-                Subject(id="s2", name="Subject 2"),
-            ],
-            rooms=[
-                Room(id="r1", name="Room 1", type=RoomType.CLASSROOM),
-                Room(id="r2", name="Room 2", type=RoomType.CLASSROOM),
-            ],
-            lessons=[
-                # Same class, different teachers
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="s1", lessons_per_week=1),
-                Lesson(id="l2", teacher_id="t2", class_id="c1", subject_id="s2", lessons_per_week=1),
-            ],
-            periods=[
-                Period(id="p1", name="P1", day=0, start_minutes=540, end_minutes=600),
-                Period(id="p2", name="P2", day=0, start_minutes=600, end_minutes=660),
-            ],
-        )
+@pytest.mark.slow
+class TestNoOverlap:
+    """Tests for no-overlap constraints."""
 
-        builder = TimetableModelBuilder(input_data)
-        solution = builder.solve(time_limit_seconds=30)
+    @pytest.mark.parametrize(
+        "build_input, key, expected_assignments",
+        [
+            (_teacher_overlap_input, "teacher_id", 2),
+            (_class_overlap_input, "class_id", 2),
+        ],
+        ids=["teacher", "class"],
+    )
+    def test_no_overlap(self, build_input, key, expected_assignments):
+        """Test that a teacher or class can't be double-booked."""
+        builder = TimetableModelBuilder(build_input())
+        solution = builder.solve(time_limit_seconds=SOLVE_LIMIT, num_search_workers=1)
 
         assert solution.is_feasible
+        assert len(solution.assignments) == expected_assignments
 
-        # Lessons should be at different times
-        times = [(a.day, a.start_minutes) for a in solution.assignments]
-        assert len(set(times)) == 2, "Class's lessons should be at different times"
+        # The shared teacher's or class's lessons should not overlap
+        assert_no_double_booking(solution.assignments, key, key)
 
 
 class TestInfeasibility:
     """Tests for infeasible scenarios."""
 
-    def test_too_many_lessons(self):
-        """Test infeasibility when there aren't enough slots."""
-        input_data = TimetableInput(
-            config=SchoolConfig(school_name="Test", num_days=1),
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1")],
-            subjects=[Subject(id="s1", name="Subject 1")],
-            rooms=[Room(id="r1", name="Room 1", type=RoomType.CLASSROOM)],
-            lessons=[
-                # 3 lessons but only 2 slots
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="s1", lessons_per_week=3),
-            ],
-            periods=[
-                Period(id="p1", name="P1", day=0, start_minutes=540, end_minutes=600),
-                Period(id="p2", name="P2", day=0, start_minutes=600, end_minutes=660),
+    def test_too_many_lessons_for_teacher_caught_by_validation(self):
+        """A teacher with more lessons than slots is rejected before any solve."""
+        with pytest.raises(ValidationError, match="3 lessons but only 2 time slots"):
+            make_input([make_lesson(lessons_per_week=3)], periods=period_grid(1, 2), num_days=1)
+
+    @pytest.mark.slow
+    def test_too_many_lessons_for_class(self):
+        """Test infeasibility when a class has more lessons than slots."""
+        input_data = make_input(
+            # Each teacher fits in 3 slots, but their shared class needs 4
+            [
+                make_lesson(lessons_per_week=2),
+                make_lesson(id="l2", teacher_id="t2", subject_id="eng", lessons_per_week=2),
             ],
+            teachers=2,
+            rooms=2,
+            periods=period_grid(1, 3),
+            num_days=1,
         )
 
         builder = TimetableModelBuilder(input_data)
-        solution = builder.solve(time_limit_seconds=10)
+        solution = builder.solve(time_limit_seconds=SOLVE_LIMIT, num_search_workers=1)
 
         assert solution.status == SolverStatus.INFEASIBLE
 
     def test_no_suitable_room_caught_by_validation(self):
         """Test that missing room types are caught by Pydantic validation."""
-        from pydantic import ValidationError
-
         # This should be caught by Pydantic validation, not the solver
         with pytest.raises(ValidationError, match="requires science_lab"):
-            TimetableInput(
-                config=SchoolConfig(school_name="Test", num_days=1),
-                teachers=[Teacher(id="t1", name="Teacher 1")],
-                classes=[StudentClass(id="c1", name="Class 1")],
+            make_input(
+                # Default rooms are classrooms only, no lab
+                [make_lesson(subject_id="sci")],
                 subjects=[
                     Subject(id="sci", name="Science", requires_specialist_room=True,
                            required_room_type=RoomType.SCIENCE_LAB),
                 ],
-                rooms=[
-                    # Only classrooms, no lab
-                    Room(id="r1", name="Room 1", type=RoomType.CLASSROOM),
-                ],
-                lessons=[
-                    Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="sci", lessons_per_week=1),
-                ],
-                periods=[
-                    Period(id="p1", name="P1", day=0, start_minutes=540, end_minutes=600),
-                ],
+                num_days=1,
             )
 
+    @pytest.mark.slow
     def test_room_fully_booked(self):
         """Test infeasibility when room is fully booked."""
-        input_data = TimetableInput(
-            config=SchoolConfig(school_name="Test", num_days=1),
-            teachers=[
-                Teacher(id="t1", name="Teacher 1"),
-                Teacher(id="t2", name="Teacher 2"),
-            ],
-            classes=[
-                StudentClass(id="c1", name="Class 1"),
-                StudentClass(id="c2", name="Class 2"),
-            ],
-            subjects=[Subject(id="s1", name="Subject 1")],
-            rooms=[
-                # Only one room
-                Room(id="r1", name="Room 1", type=RoomType.CLASSROOM),
-            ],
-            lessons=[
+        input_data = make_input(
+            [
                 # Two lessons that must both use the same room, same time slot
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="s1", lessons_per_week=2),
-                Lesson(id="l2", teacher_id="t2", class_id="c2", subject_id="s1", lessons_per_week=2),
-            ],
-            periods=[
-                # Only one period - impossible to fit 4 lesson instances
-                Period(id="p1", name="P1", day=0, start_minutes=540, end_minutes=600),
+                make_lesson(),
+                make_lesson(id="l2", teacher_id="t2", class_id="c2"),
             ],
+            teachers=2,
+            classes=2,
+            # Only one room and one period (the defaults)
+            num_days=1,
         )
 
         builder = TimetableModelBuilder(input_data)
-        solution = builder.solve(time_limit_seconds=10)
+        solution = builder.solve(time_limit_seconds=SOLVE_LIMIT, num_search_workers=1)
 
-        # Should be infeasible - only 1 slot but need to place 4 lessons
+        # Each teacher and class fits, but the single room can't host both lessons
         assert solution.status == SolverStatus.INFEASIBLE
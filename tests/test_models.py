@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 from pathlib import Path
 
@@ -23,22 +25,25 @@ from solver.data.models import (
 )
 
 
+def _patch_json(raw: bytes, old: bytes, new: bytes) -> bytes:
+    """Replace the first occurrence of old in serialized JSON."""
+    assert old in raw, f"{old!r} not found in template"
+    return raw.replace(old, new, 1)
+
+
+TIME_CASES = [(0, "00:00"), (540, "09:00"), (750, "12:30"), (915, "15:15"), (1439, "23:59")]
+
+
 class TestTimeHelpers:
     """Tests for time conversion helpers."""
 
-    def test_minutes_to_time(self):
-        assert minutes_to_time(0) == "00:00"
-        assert minutes_to_time(540) == "09:00"
-        assert minutes_to_time(750) == "12:30"
-        assert minutes_to_time(915) == "15:15"
-        assert minutes_to_time(1439) == "23:59"
+    @pytest.mark.parametrize("minutes, text", TIME_CASES)
+    def test_minutes_to_time(self, minutes, text):
+        assert minutes_to_time(minutes) == text
 
-    def test_time_to_minutes(self):
-        assert time_to_minutes("00:00") == 0
-        assert time_to_minutes("09:00") == 540
-        assert time_to_minutes("12:30") == 750
-        assert time_to_minutes("15:15") == 915
-        assert time_to_minutes("23:59") == 1439
+    @pytest.mark.parametrize("minutes, text", TIME_CASES)
+    def test_time_to_minutes(self, minutes, text):
+        assert time_to_minutes(text) == minutes
 
 
 class TestAvailability:
@@ -203,118 +208,102 @@ class TestLesson:
         assert lesson.room_requirement.room_type == RoomType.SCIENCE_LAB
 
 
+@pytest.fixture(scope="session")
+def input_template() -> bytes:
+    """Minimal valid input serialized once; enough periods for feasibility."""
+    return json.dumps({
+        "teachers": [{"id": "t1", "name": "Teacher 1"}],
+        "classes": [{"id": "7a", "name": "Year 7A"}],
+        "subjects": [{"id": "mat", "name": "Maths"}],
+        "rooms": [{"id": "r1", "name": "Room 1", "type": "classroom"}],
+        "lessons": [
+            {"id": "l1", "teacher_id": "t1", "class_id": "7a", "subject_id": "mat", "lessons_per_week": 5}
+        ],
+        "periods": [
+            {"id": "p1", "name": "Period 1", "day": 0, "start_minutes": 540, "end_minutes": 600},
+            {"id": "p2", "name": "Period 2", "day": 1, "start_minutes": 540, "end_minutes": 600},
+            {"id": "p3", "name": "Period 3", "day": 2, "start_minutes": 540, "end_minutes": 600},
+            {"id": "p4", "name": "Period 4", "day": 3, "start_minutes": 540, "end_minutes": 600},
+            {"id": "p5", "name": "Period 5", "day": 4, "start_minutes": 540, "end_minutes": 600},
+        ]
+    }).encode()
+
+
+@pytest.fixture
+def minimal_valid_input(input_template) -> dict:
+    """Fresh, mutable copy of the minimal valid input."""
+    return json.loads(input_template)
+
+
+@pytest.fixture(scope="session")
+def validated_minimal(tt_adapter, input_template) -> TimetableInput:
+    """Minimal valid input validated once for read-only tests."""
+    return tt_adapter.validate_python(json.loads(input_template))
+
+
+# (mutation applied to a fresh input dict, expected error pattern)
+MUTATION_CASES = [
+    (lambda d: d.pop("teachers"), None),
+    (lambda d: d["teachers"].append({"id": "t1", "name": "Duplicate"}), "Duplicate teacher ID"),
+]
+
+# (lesson reference field, its valid value in the template)
+REFERENCE_CASES = [("teacher_id", "t1"), ("class_id", "7a"), ("subject_id", "mat")]
+
+
 class TestTimetableInput:
     """Tests for the main TimetableInput model."""
 
-    @pytest.fixture
-    def minimal_valid_input(self) -> dict:
-        """Minimal valid input data with enough periods for feasibility."""
-        return {
-            "teachers": [{"id": "t1", "name": "Teacher 1"}],
-            "classes": [{"id": "7a", "name": "Year 7A"}],
-            "subjects": [{"id": "mat", "name": "Maths"}],
-            "rooms": [{"id": "r1", "name": "Room 1", "type": "classroom"}],
-            "lessons": [
-                {"id": "l1", "teacher_id": "t1", "class_id": "7a", "subject_id": "mat", "lessons_per_week": 5}
-            ],
-            "periods": [
-                {"id": "p1", "name": "Period 1", "day": 0, "start_minutes": 540, "end_minutes": 600},
-                {"id": "p2", "name": "Period 2", "day": 1, "start_minutes": 540, "end_minutes": 600},
-                {"id": "p3", "name": "Period 3", "day": 2, "start_minutes": 540, "end_minutes": 600},
-                {"id": "p4", "name": "Period 4", "day": 3, "start_minutes": 540, "end_minutes": 600},
-                {"id": "p5", "name": "Period 5", "day": 4, "start_minutes": 540, "end_minutes": 600},
-            ]
-        }
-
-    def test_valid_input(self, minimal_valid_input):
+    def test_valid_input(self, validated_minimal):
         """Test that minimal valid input passes validation."""
-        timetable = TimetableInput.model_validate(minimal_valid_input)
+        timetable = validated_minimal
         assert len(timetable.teachers) == 1
         assert len(timetable.lessons) == 1
 
-    def test_missing_teachers(self, minimal_valid_input):
-        """Test validation fails without teachers."""
-        del minimal_valid_input["teachers"]
-        with pytest.raises(ValueError):
-            TimetableInput.model_validate(minimal_valid_input)
-
-    def test_invalid_teacher_reference(self, minimal_valid_input):
-        """Test validation fails with invalid teacher reference."""
-        minimal_valid_input["lessons"][0]["teacher_id"] = "nonexistent"
-        with pytest.raises(ValueError, match="unknown teacher_id"):
-            TimetableInput.model_validate(minimal_valid_input)
-
-    def test_invalid_class_reference(self, minimal_valid_input):
-        """Test validation fails with invalid class reference."""
-        minimal_valid_input["lessons"][0]["class_id"] = "nonexistent"
-        with pytest.raises(ValueError, match="unknown class_id"):
-            TimetableInput.model_validate(minimal_valid_input)
-
-    def test_invalid_subject_reference(self, minimal_valid_input):
-        """Test validation fails with invalid subject reference."""
-        minimal_valid_input["lessons"][0]["subject_id"] = "nonexistent"
-        with pytest.raises(ValueError, match="unknown subject_id"):
-            TimetableInput.model_validate(minimal_valid_input)
-
-    def test_duplicate_teacher_ids(self, minimal_valid_input):
-        """Test validation fails with duplicate IDs."""
-        minimal_valid_input["teachers"].append({"id": "t1", "name": "Duplicate"})
-        with pytest.raises(ValueError, match="Duplicate teacher ID"):
-            TimetableInput.model_validate(minimal_valid_input)
-
-    def test_teacher_overload_validation(self):
+    @pytest.mark.parametrize("mutate, match", MUTATION_CASES, ids=["missing-teachers", "duplicate-teacher-id"])
+    def test_invalid_structure(self, tt_adapter, minimal_valid_input, mutate, match):
+        """Test validation fails for structurally invalid input."""
+        mutate(minimal_valid_input)
+        with pytest.raises(ValueError, match=match):
+            tt_adapter.validate_python(minimal_valid_input)
+
+    @pytest.mark.parametrize("field, value", REFERENCE_CASES, ids=["teacher", "class", "subject"])
+    def test_invalid_reference(self, tt_adapter, input_template, field, value):
+        """Test validation fails when a lesson references an unknown entity."""
+        raw = _patch_json(
+            input_template,
+            f'"{field}": "{value}"'.encode(),
+            f'"{field}": "nonexistent"'.encode(),
+        )
+        with pytest.raises(ValueError, match=f"unknown {field}"):
+            tt_adapter.validate_json(raw)
+
+    def test_teacher_overload_validation(self, tt_adapter, minimal_valid_input):
         """Test validation fails when teacher has more lessons than time slots."""
         # Only 1 period available, but teacher assigned 5 lessons
-        data = {
-            "teachers": [{"id": "t1", "name": "Teacher 1"}],
-            "classes": [{"id": "7a", "name": "Year 7A"}],
-            "subjects": [{"id": "mat", "name": "Maths"}],
-            "rooms": [{"id": "r1", "name": "Room 1", "type": "classroom"}],
-            "lessons": [
-                {"id": "l1", "teacher_id": "t1", "class_id": "7a", "subject_id": "mat", "lessons_per_week": 5}
-            ],
-            "periods": [
-                {"id": "p1", "name": "Period 1", "day": 0, "start_minutes": 540, "end_minutes": 600}
-            ]
-        }
+        data = {**minimal_valid_input, "periods": minimal_valid_input["periods"][:1]}
         with pytest.raises(ValueError, match="infeasible"):
-            TimetableInput.model_validate(data)
+            tt_adapter.validate_python(data)
 
-    def test_teacher_load_within_capacity(self):
+    def test_teacher_load_within_capacity(self, tt_adapter, minimal_valid_input):
         """Test validation passes when teacher load is within capacity."""
         # 5 periods available, teacher assigned 5 lessons - should pass
-        data = {
-            "teachers": [{"id": "t1", "name": "Teacher 1"}],
-            "classes": [{"id": "7a", "name": "Year 7A"}],
-            "subjects": [{"id": "mat", "name": "Maths"}],
-            "rooms": [{"id": "r1", "name": "Room 1", "type": "classroom"}],
-            "lessons": [
-                {"id": "l1", "teacher_id": "t1", "class_id": "7a", "subject_id": "mat", "lessons_per_week": 5}
-            ],
-            "periods": [
-                {"id": "p1", "name": "Period 1", "day": 0, "start_minutes": 540, "end_minutes": 600},
-                {"id": "p2", "name": "Period 2", "day": 1, "start_minutes": 540, "end_minutes": 600},
-                {"id": "p3", "name": "Period 3", "day": 2, "start_minutes": 540, "end_minutes": 600},
-                {"id": "p4", "name": "Period 4", "day": 3, "start_minutes": 540, "end_minutes": 600},
-                {"id": "p5", "name": "Period 5", "day": 4, "start_minutes": 540, "end_minutes": 600},
-            ]
-        }
-        # Should not raise
-        timetable = TimetableInput.model_validate(data)
+        assert len(minimal_valid_input["periods"]) == 5
+        timetable = tt_adapter.validate_python(minimal_valid_input)
         assert len(timetable.lessons) == 1
 
-    def test_lookup_methods(self, minimal_valid_input):
+    def test_lookup_methods(self, validated_minimal):
         """Test entity lookup methods."""
-        timetable = TimetableInput.model_validate(minimal_valid_input)
+        timetable = validated_minimal
 
         assert timetable.get_teacher("t1") is not None
         assert timetable.get_teacher("nonexistent") is None
         assert timetable.get_class("7a") is not None
         assert timetable.get_subject("mat") is not None
 
-    def test_query_methods(self, minimal_valid_input):
+    def test_query_methods(self, validated_minimal):
         """Test query methods."""
-        timetable = TimetableInput.model_validate(minimal_valid_input)
+        timetable = validated_minimal
 
         lessons = timetable.get_teacher_lessons("t1")
         assert len(lessons) == 1
@@ -322,9 +311,9 @@ class TestTimetableInput:
         lessons = timetable.get_class_lessons("7a")
         assert len(lessons) == 1
 
-    def test_summary(self, minimal_valid_input):
+    def test_summary(self, validated_minimal):
         """Test summary generation."""
-        timetable = TimetableInput.model_validate(minimal_valid_input)
+        timetable = validated_minimal
         summary = timetable.summary()
 
         assert summary["teachers"] == 1
@@ -332,17 +321,29 @@ class TestTimetableInput:
         assert summary["total_lessons_per_week"] == 5
 
 
+SAMPLE_PATH = Path(__file__).parent.parent / "data" / "sample-timetable.json"
+
+
+@pytest.fixture(scope="session")
+def sample_bytes() -> bytes:
+    """Raw bytes of the sample timetable file, read once per session."""
+    if not SAMPLE_PATH.exists():
+        pytest.skip("Sample file not found")
+    return SAMPLE_PATH.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def sample_timetable(sample_bytes) -> TimetableInput:
+    """Sample timetable loaded and validated once per session."""
+    return load_timetable_from_json(str(SAMPLE_PATH))
+
+
 class TestLoadFromJson:
     """Tests for JSON loading."""
 
-    def test_load_sample_file(self):
+    def test_load_sample_file(self, sample_timetable):
         """Test loading the sample timetable file."""
-        sample_path = Path(__file__).parent.parent / "data" / "sample-timetable.json"
-
-        if not sample_path.exists():
-            pytest.skip("Sample file not found")
-
-        timetable = load_timetable_from_json(str(sample_path))
+        timetable = sample_timetable
 
         assert timetable.config.school_name == "Westbrook Academy"
         assert len(timetable.teachers) == 8
@@ -352,6 +353,13 @@ class TestLoadFromJson:
         assert len(timetable.lessons) == 16
         assert len(timetable.periods) == 40
 
+    def test_sample_counts_match_raw_json(self, sample_bytes, sample_timetable):
+        """Test the loaded model keeps every entity from the raw file."""
+        raw = json.loads(sample_bytes)
+
+        for key in ("teachers", "classes", "subjects", "rooms", "lessons", "periods"):
+            assert len(getattr(sample_timetable, key)) == len(raw[key])
+
     def test_load_nonexistent_file(self):
         """Test loading a nonexistent file raises error."""
         with pytest.raises(FileNotFoundError):
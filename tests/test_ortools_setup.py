@@ -3,6 +3,11 @@
 from ortools.sat.python import cp_model
 
 
+# One solver reused by both checks; it keeps no model state between solves.
+_SOLVER = cp_model.CpSolver()
+_SOLVER.parameters.num_search_workers = 1
+
+
 def test_cpsat_simple_constraint():
     """
     Verify OR-Tools CP-SAT works by solving a trivial constraint problem.
@@ -25,7 +30,7 @@ def test_cpsat_simple_constraint():
     model.Add(y < z)
 
     # Solve
-    solver = cp_model.CpSolver()
+    solver = _SOLVER
     status = solver.Solve(model)
 
     # Verify solution found
@@ -57,31 +62,28 @@ def test_cpsat_boolean_satisfiability():
     # task_slot[t][s] = 1 if task t is in slot s
     tasks = 3
     slots = 2
-    task_slot = {}
-
-    for t in range(tasks):
-        for s in range(slots):
-            task_slot[(t, s)] = model.NewBoolVar(f'task{t}_slot{s}')
+    task_slot = [
+        [model.NewBoolVar(f'task{t}_slot{s}') for s in range(slots)]
+        for t in range(tasks)
+    ]
 
     # Each task assigned to exactly one slot
-    for t in range(tasks):
-        model.AddExactlyOne([task_slot[(t, s)] for s in range(slots)])
+    for row in task_slot:
+        model.AddExactlyOne(row)
 
     # Slot 0 can have at most 1 task
-    model.Add(sum(task_slot[(t, 0)] for t in range(tasks)) <= 1)
+    model.Add(sum(row[0] for row in task_slot) <= 1)
 
     # Solve
-    solver = cp_model.CpSolver()
+    solver = _SOLVER
     status = solver.Solve(model)
 
     assert status == cp_model.OPTIMAL or status == cp_model.FEASIBLE
 
     # Count assignments per slot
-    slot_counts = [0, 0]
-    for t in range(tasks):
-        for s in range(slots):
-            if solver.Value(task_slot[(t, s)]):
-                slot_counts[s] += 1
+    slot_counts = [
+        sum(solver.Value(row[s]) for row in task_slot) for s in range(slots)
+    ]
 
     assert slot_counts[0] <= 1, "Slot 0 should have at most 1 task"
     assert sum(slot_counts) == tasks, "All tasks should be assigned"
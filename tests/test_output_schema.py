@@ -123,6 +123,14 @@ class TestLessonOutput:
         assert "classId" in data
         assert "subjectId" in data
 
+    def test_to_dict_matches_model_dump(self, sample_assignments):
+        """to_dict() produces exactly the aliased model_dump() output."""
+        for assignment in sample_assignments:
+            output = LessonOutput.from_assignment(assignment)
+
+            assert output.to_dict() == output.model_dump(by_alias=True)
+            assert list(output.to_dict()) == list(output.model_dump(by_alias=True))
+
     def test_time_formatting(self):
         """Time is formatted as HH:MM."""
         assignment = LessonAssignment(
@@ -428,3 +436,12 @@ class TestTimetableOutputSerialization:
 
         assert isinstance(data, dict)
         assert data["status"] == "optimal"
+
+    def test_round_trip_ignores_unknown_keys(self, sample_solution):
+        """Saved output with extra keys still loads, as cli.load_output relies on."""
+        output = create_timetable_output(sample_solution)
+        data = output.to_dict()
+        data["futureField"] = 1
+        data["timetable"]["lessons"][0]["futureField"] = 1
+
+        assert TimetableOutput.model_validate(data) == output
@@ -6,12 +6,9 @@ import pytest
 
 from solver.data.models import (
     TimetableInput,
-    Teacher,
     StudentClass,
     Subject,
     Room,
-    Lesson,
-    Period,
     RoomType,
     RoomRequirement,
 )
@@ -25,24 +22,51 @@ from solver.constraints.rooms import (
     get_lessons_without_valid_rooms,
     RoomConstraintStats,
 )
+from tests._factories import make_input, make_lesson, period_grid
 
 
-@pytest.fixture
+# Seconds per solve: these one- and two-lesson models settle in
+# milliseconds, so a short limit makes a regression fail fast.
+SOLVE_LIMIT = 2
+
+
+def _built(input_data: TimetableInput) -> TimetableModelBuilder:
+    """
+    Fresh builder over input_data with variables created.
+
+    Room filtering and the diagnostics only read builder.input, so those
+    tests use a bare TimetableModelBuilder and skip variable creation.
+    """
+    builder = TimetableModelBuilder(input_data)
+    builder.create_variables()
+    return builder
+
+
+@pytest.fixture(scope="module")
 def basic_input() -> TimetableInput:
-    """Create basic timetable input for testing."""
-    return TimetableInput(
-        teachers=[Teacher(id="t1", name="Teacher 1")],
-        classes=[StudentClass(id="c1", name="Class 1", student_count=25)],
-        subjects=[Subject(id="mat", name="Maths")],
+    """Create basic timetable input for testing (shared; do not mutate)."""
+    return make_input(
         rooms=[
             Room(id="r1", name="Room 1", type=RoomType.CLASSROOM, capacity=30),
             Room(id="r2", name="Room 2", type=RoomType.CLASSROOM, capacity=20),
         ],
-        lessons=[
-            Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=1),
+        lessons=[make_lesson()],
+        classes=[StudentClass(id="c1", name="Class 1", student_count=25)],
+    )
+
+
+@pytest.fixture(scope="module")
+def science_lab_input() -> TimetableInput:
+    """Science lesson whose subject needs a lab, with a classroom as the decoy."""
+    return make_input(
+        rooms=[
+            Room(id="r1", name="Classroom", type=RoomType.CLASSROOM, capacity=30),
+            Room(id="lab1", name="Science Lab", type=RoomType.SCIENCE_LAB, capacity=24),
         ],
-        periods=[
-            Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
+        lessons=[make_lesson(subject_id="sci")],
+        subjects=[
+            Subject(id="sci", name="Science", requires_specialist_room=True,
+                   required_room_type=RoomType.SCIENCE_LAB),
         ],
     )
 
@@ -53,7 +77,6 @@ class TestGetValidRoomsForLesson:
     def test_all_rooms_valid_when_no_requirements(self, basic_input):
         """All rooms are valid when no specific requirements."""
         builder = TimetableModelBuilder(basic_input)
-        builder.create_variables()
 
         lesson = basic_input.lessons[0]
         valid_rooms = get_valid_rooms_for_lesson(builder, lesson)
@@ -62,29 +85,10 @@ class TestGetValidRoomsForLesson:
         assert 0 in valid_rooms  # r1 with capacity 30
         assert 1 not in valid_rooms  # r2 with capacity 20 < 25
 
-    def test_filters_by_room_type(self):
+    def test_filters_by_room_type(self, science_lab_input):
         """Filters rooms by required room type."""
-        input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1")],
-            subjects=[
-                Subject(id="sci", name="Science", requires_specialist_room=True,
-                       required_room_type=RoomType.SCIENCE_LAB),
-            ],
-            rooms=[
-                Room(id="r1", name="Classroom", type=RoomType.CLASSROOM, capacity=30),
-                Room(id="lab1", name="Science Lab", type=RoomType.SCIENCE_LAB, capacity=24),
-            ],
-            lessons=[
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="sci", lessons_per_week=1),
-            ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-            ],
-        )
-
+        input_data = science_lab_input
         builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
 
         lesson = input_data.lessons[0]
         valid_rooms = get_valid_rooms_for_lesson(builder, lesson)
@@ -93,28 +97,21 @@ class TestGetValidRoomsForLesson:
 
     def test_filters_by_lesson_room_type_requirement(self):
         """Lesson's explicit room type requirement overrides subject."""
-        input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1")],
-            subjects=[Subject(id="pe", name="PE")],
+        input_data = make_input(
             rooms=[
                 Room(id="r1", name="Classroom", type=RoomType.CLASSROOM),
                 Room(id="gym", name="Gymnasium", type=RoomType.GYM),
             ],
             lessons=[
-                Lesson(
-                    id="l1", teacher_id="t1", class_id="c1", subject_id="pe",
-                    lessons_per_week=1,
-                    room_requirement=RoomRequirement(room_type=RoomType.GYM)
+                make_lesson(
+                    subject_id="pe",
+                    room_requirement=RoomRequirement(room_type=RoomType.GYM),
                 ),
             ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-            ],
+            subjects=[Subject(id="pe", name="PE")],
         )
 
         builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
 
         lesson = input_data.lessons[0]
         valid_rooms = get_valid_rooms_for_lesson(builder, lesson)
@@ -123,25 +120,17 @@ class TestGetValidRoomsForLesson:
 
     def test_filters_by_capacity(self):
         """Filters rooms by minimum capacity."""
-        input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1", student_count=28)],
-            subjects=[Subject(id="mat", name="Maths")],
+        input_data = make_input(
             rooms=[
                 Room(id="r1", name="Small Room", type=RoomType.CLASSROOM, capacity=20),
                 Room(id="r2", name="Medium Room", type=RoomType.CLASSROOM, capacity=25),
                 Room(id="r3", name="Large Room", type=RoomType.CLASSROOM, capacity=35),
             ],
-            lessons=[
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=1),
-            ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-            ],
+            lessons=[make_lesson()],
+            classes=[StudentClass(id="c1", name="Class 1", student_count=28)],
         )
 
         builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
 
         lesson = input_data.lessons[0]
         valid_rooms = get_valid_rooms_for_lesson(builder, lesson)
@@ -151,29 +140,12 @@ class TestGetValidRoomsForLesson:
 
     def test_filters_excluded_rooms(self):
         """Excludes specific rooms."""
-        input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1")],
-            subjects=[Subject(id="mat", name="Maths")],
-            rooms=[
-                Room(id="r1", name="Room 1", type=RoomType.CLASSROOM),
-                Room(id="r2", name="Room 2", type=RoomType.CLASSROOM),
-                Room(id="r3", name="Room 3", type=RoomType.CLASSROOM),
-            ],
-            lessons=[
-                Lesson(
-                    id="l1", teacher_id="t1", class_id="c1", subject_id="mat",
-                    lessons_per_week=1,
-                    room_requirement=RoomRequirement(excluded_rooms=["r1", "r3"])
-                ),
-            ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-            ],
+        input_data = make_input(
+            rooms=3,
+            lessons=[make_lesson(room_requirement=RoomRequirement(excluded_rooms=["r1", "r3"]))],
         )
 
         builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
 
         lesson = input_data.lessons[0]
         valid_rooms = get_valid_rooms_for_lesson(builder, lesson)
@@ -182,29 +154,12 @@ class TestGetValidRoomsForLesson:
 
     def test_specific_room_requirement(self):
         """Restricts to specific preferred rooms."""
-        input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1")],
-            subjects=[Subject(id="mat", name="Maths")],
-            rooms=[
-                Room(id="r1", name="Room 1", type=RoomType.CLASSROOM),
-                Room(id="r2", name="Room 2", type=RoomType.CLASSROOM),
-                Room(id="r3", name="Room 3", type=RoomType.CLASSROOM),
-            ],
-            lessons=[
-                Lesson(
-                    id="l1", teacher_id="t1", class_id="c1", subject_id="mat",
-                    lessons_per_week=1,
-                    room_requirement=RoomRequirement(preferred_rooms=["r2"])
-                ),
-            ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-            ],
+        input_data = make_input(
+            rooms=3,
+            lessons=[make_lesson(room_requirement=RoomRequirement(preferred_rooms=["r2"]))],
         )
 
         builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
 
         lesson = input_data.lessons[0]
         valid_rooms = get_valid_rooms_for_lesson(builder, lesson)
@@ -213,10 +168,7 @@ class TestGetValidRoomsForLesson:
 
     def test_equipment_requirement(self):
         """Filters by required equipment."""
-        input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1")],
-            subjects=[Subject(id="cs", name="Computer Science")],
+        input_data = make_input(
             rooms=[
                 Room(id="r1", name="Classroom", type=RoomType.CLASSROOM),
                 Room(id="comp1", name="Computer Lab", type=RoomType.COMPUTER_LAB,
@@ -225,22 +177,18 @@ class TestGetValidRoomsForLesson:
                      equipment=["computers"]),
             ],
             lessons=[
-                Lesson(
-                    id="l1", teacher_id="t1", class_id="c1", subject_id="cs",
-                    lessons_per_week=1,
+                make_lesson(
+                    subject_id="cs",
                     room_requirement=RoomRequirement(
                         room_type=RoomType.COMPUTER_LAB,
                         requires_equipment=["computers", "projector"]
-                    )
+                    ),
                 ),
             ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-            ],
+            subjects=[Subject(id="cs", name="Computer Science")],
         )
 
         builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
 
         lesson = input_data.lessons[0]
         valid_rooms = get_valid_rooms_for_lesson(builder, lesson)
@@ -252,29 +200,10 @@ class TestGetValidRoomsForLesson:
 class TestRoomAssignmentConstraints:
     """Tests for AddAllowedAssignments constraints."""
 
-    def test_adds_constraints_when_rooms_filtered(self):
+    def test_adds_constraints_when_rooms_filtered(self, science_lab_input):
         """Adds constraints when some rooms are not valid."""
-        input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1")],
-            subjects=[
-                Subject(id="sci", name="Science", requires_specialist_room=True,
-                       required_room_type=RoomType.SCIENCE_LAB),
-            ],
-            rooms=[
-                Room(id="r1", name="Classroom", type=RoomType.CLASSROOM),
-                Room(id="lab1", name="Science Lab", type=RoomType.SCIENCE_LAB),
-            ],
-            lessons=[
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="sci", lessons_per_week=1),
-            ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-            ],
-        )
-
-        builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
+        input_data = science_lab_input
+        builder = _built(input_data)
 
         count = add_room_assignment_constraints(builder)
 
@@ -283,56 +212,22 @@ class TestRoomAssignmentConstraints:
 
     def test_no_constraints_when_all_rooms_valid(self):
         """No constraints added when all rooms are valid."""
-        input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1")],
-            subjects=[Subject(id="mat", name="Maths")],
-            rooms=[
-                Room(id="r1", name="Room 1", type=RoomType.CLASSROOM),
-                Room(id="r2", name="Room 2", type=RoomType.CLASSROOM),
-            ],
-            lessons=[
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=1),
-            ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-            ],
-        )
+        input_data = make_input(rooms=2, lessons=[make_lesson()])
 
-        builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
+        builder = _built(input_data)
 
         count = add_room_assignment_constraints(builder)
 
         assert count == 0  # No filtering needed
 
-    def test_solver_respects_room_type_constraint(self):
+    def test_solver_respects_room_type_constraint(self, science_lab_input):
         """Solver assigns lessons to correct room types."""
-        input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1")],
-            subjects=[
-                Subject(id="sci", name="Science", requires_specialist_room=True,
-                       required_room_type=RoomType.SCIENCE_LAB),
-            ],
-            rooms=[
-                Room(id="r1", name="Classroom", type=RoomType.CLASSROOM),
-                Room(id="lab1", name="Science Lab", type=RoomType.SCIENCE_LAB),
-            ],
-            lessons=[
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="sci", lessons_per_week=1),
-            ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-            ],
-        )
-
-        builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
+        input_data = science_lab_input
+        builder = _built(input_data)
         add_room_assignment_constraints(builder)
         builder._add_valid_time_slots_constraint()
 
-        solution = builder.solve(time_limit_seconds=10)
+        solution = builder.solve(time_limit_seconds=SOLVE_LIMIT, num_search_workers=1)
 
         assert solution.is_feasible
         assert len(solution.assignments) == 1
@@ -344,25 +239,13 @@ class TestRoomNoOverlapWithOptionalIntervals:
 
     def test_creates_optional_intervals(self):
         """Creates optional intervals for potential room assignments."""
-        input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1")],
-            subjects=[Subject(id="mat", name="Maths")],
-            rooms=[
-                Room(id="r1", name="Room 1", type=RoomType.CLASSROOM),
-                Room(id="r2", name="Room 2", type=RoomType.CLASSROOM),
-            ],
-            lessons=[
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=2),
-            ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-                Period(id="mon2", name="Mon P2", day=0, start_minutes=600, end_minutes=660),
-            ],
+        input_data = make_input(
+            rooms=2,
+            lessons=[make_lesson(lessons_per_week=2)],
+            periods=period_grid(1, 2),
         )
 
-        builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
+        builder = _built(input_data)
 
         constraints, intervals = add_room_no_overlap_with_optional_intervals(builder)
 
@@ -373,39 +256,24 @@ class TestRoomNoOverlapWithOptionalIntervals:
 
     def test_prevents_room_double_booking(self):
         """Room cannot host two lessons at the same time."""
-        input_data = TimetableInput(
-            teachers=[
-                Teacher(id="t1", name="Teacher 1"),
-                Teacher(id="t2", name="Teacher 2"),
-            ],
-            classes=[
-                StudentClass(id="c1", name="Class 1"),
-                StudentClass(id="c2", name="Class 2"),
-            ],
-            subjects=[Subject(id="mat", name="Maths")],
-            rooms=[
-                Room(id="r1", name="Room 1", type=RoomType.CLASSROOM),  # Only 1 room
-            ],
+        input_data = make_input(
+            rooms=1,  # Only 1 room
             lessons=[
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=2),
-                Lesson(id="l2", teacher_id="t2", class_id="c2", subject_id="mat", lessons_per_week=2),
-            ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-                Period(id="mon2", name="Mon P2", day=0, start_minutes=600, end_minutes=660),
-                Period(id="tue1", name="Tue P1", day=1, start_minutes=540, end_minutes=600),
-                Period(id="tue2", name="Tue P2", day=1, start_minutes=600, end_minutes=660),
+                make_lesson(lessons_per_week=2),
+                make_lesson(id="l2", teacher_id="t2", class_id="c2", lessons_per_week=2),
             ],
+            teachers=2,
+            classes=2,
+            periods=period_grid(2, 2),
         )
 
-        builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
+        builder = _built(input_data)
         add_room_no_overlap_with_optional_intervals(builder)
         builder._add_valid_time_slots_constraint()
         builder._add_teacher_no_overlap_constraint()
         builder._add_class_no_overlap_constraint()
 
-        solution = builder.solve(time_limit_seconds=10)
+        solution = builder.solve(time_limit_seconds=SOLVE_LIMIT, num_search_workers=1)
 
         assert solution.is_feasible
 
@@ -422,31 +290,22 @@ class TestAddAllRoomConstraints:
 
     def test_returns_stats(self):
         """Returns statistics about constraints added."""
-        input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1", student_count=25)],
-            subjects=[
-                Subject(id="sci", name="Science", requires_specialist_room=True,
-                       required_room_type=RoomType.SCIENCE_LAB),
-            ],
+        input_data = make_input(
             rooms=[
                 Room(id="r1", name="Classroom", type=RoomType.CLASSROOM, capacity=30),
                 Room(id="lab1", name="Science Lab", type=RoomType.SCIENCE_LAB, capacity=24),
             ],
             lessons=[
-                Lesson(
-                    id="l1", teacher_id="t1", class_id="c1", subject_id="sci",
-                    lessons_per_week=1,
-                    room_requirement=RoomRequirement(min_capacity=20)
-                ),
+                make_lesson(subject_id="sci", room_requirement=RoomRequirement(min_capacity=20)),
             ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
+            classes=[StudentClass(id="c1", name="Class 1", student_count=25)],
+            subjects=[
+                Subject(id="sci", name="Science", requires_specialist_room=True,
+                       required_room_type=RoomType.SCIENCE_LAB),
             ],
         )
 
-        builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
+        builder = _built(input_data)
 
         stats = add_all_room_constraints(builder, include_soft_constraints=False)
 
@@ -458,26 +317,9 @@ class TestAddAllRoomConstraints:
 class TestDiagnosticFunctions:
     """Tests for diagnostic/debugging functions."""
 
-    def test_analyze_room_assignments(self):
+    def test_analyze_room_assignments(self, basic_input):
         """Analyzes room suitability for lessons."""
-        input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1", student_count=25)],
-            subjects=[Subject(id="mat", name="Maths")],
-            rooms=[
-                Room(id="r1", name="Large Room", type=RoomType.CLASSROOM, capacity=30),
-                Room(id="r2", name="Small Room", type=RoomType.CLASSROOM, capacity=20),
-            ],
-            lessons=[
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=1),
-            ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-            ],
-        )
-
-        builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
+        builder = TimetableModelBuilder(basic_input)
 
         analysis = analyze_room_assignments(builder)
 
@@ -490,25 +332,17 @@ class TestDiagnosticFunctions:
         """Finds lessons that have no valid rooms due to capacity."""
         # Note: Room type mismatches are caught by Pydantic validation,
         # so we test capacity-based filtering instead
-        input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1", student_count=100)],
-            subjects=[Subject(id="mat", name="Maths")],
+        input_data = make_input(
             rooms=[
                 # All rooms too small for class of 100
                 Room(id="r1", name="Room 1", type=RoomType.CLASSROOM, capacity=30),
                 Room(id="r2", name="Room 2", type=RoomType.CLASSROOM, capacity=25),
             ],
-            lessons=[
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=1),
-            ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-            ],
+            lessons=[make_lesson()],
+            classes=[StudentClass(id="c1", name="Class 1", student_count=100)],
         )
 
         builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
 
         problematic = get_lessons_without_valid_rooms(builder)
 
@@ -527,78 +361,45 @@ class TestInfeasibleScenarios:
         from pydantic import ValidationError
 
         with pytest.raises(ValidationError, match="requires science_lab"):
-            TimetableInput(
-                teachers=[Teacher(id="t1", name="Teacher 1")],
-                classes=[StudentClass(id="c1", name="Class 1")],
+            make_input(
+                rooms=[Room(id="r1", name="Classroom", type=RoomType.CLASSROOM)],
+                lessons=[make_lesson(subject_id="sci")],
                 subjects=[
                     Subject(id="sci", name="Science", requires_specialist_room=True,
                            required_room_type=RoomType.SCIENCE_LAB),
                 ],
-                rooms=[
-                    Room(id="r1", name="Classroom", type=RoomType.CLASSROOM),
-                ],
-                lessons=[
-                    Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="sci", lessons_per_week=1),
-                ],
-                periods=[
-                    Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-                ],
             )
 
     def test_infeasible_when_all_rooms_excluded(self):
         """Infeasible when all rooms are excluded for a lesson."""
-        input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1")],
-            subjects=[Subject(id="mat", name="Maths")],
-            rooms=[
-                Room(id="r1", name="Room 1", type=RoomType.CLASSROOM),
-                Room(id="r2", name="Room 2", type=RoomType.CLASSROOM),
-            ],
-            lessons=[
-                Lesson(
-                    id="l1", teacher_id="t1", class_id="c1", subject_id="mat",
-                    lessons_per_week=1,
-                    room_requirement=RoomRequirement(excluded_rooms=["r1", "r2"])
-                ),
-            ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-            ],
+        input_data = make_input(
+            rooms=2,
+            lessons=[make_lesson(room_requirement=RoomRequirement(excluded_rooms=["r1", "r2"]))],
         )
 
-        builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
+        builder = _built(input_data)
         add_room_assignment_constraints(builder)
         builder._add_valid_time_slots_constraint()
 
-        solution = builder.solve(time_limit_seconds=10)
+        solution = builder.solve(time_limit_seconds=SOLVE_LIMIT, num_search_workers=1)
 
         assert solution.status == SolverStatus.INFEASIBLE
 
     def test_infeasible_when_capacity_insufficient(self):
         """Infeasible when no room has sufficient capacity."""
-        input_data = TimetableInput(
-            teachers=[Teacher(id="t1", name="Teacher 1")],
-            classes=[StudentClass(id="c1", name="Class 1", student_count=50)],
-            subjects=[Subject(id="mat", name="Maths")],
+        input_data = make_input(
             rooms=[
                 Room(id="r1", name="Room 1", type=RoomType.CLASSROOM, capacity=30),
                 Room(id="r2", name="Room 2", type=RoomType.CLASSROOM, capacity=25),
             ],
-            lessons=[
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=1),
-            ],
-            periods=[
-                Period(id="mon1", name="Mon P1", day=0, start_minutes=540, end_minutes=600),
-            ],
+            lessons=[make_lesson()],
+            classes=[StudentClass(id="c1", name="Class 1", student_count=50)],
         )
 
-        builder = TimetableModelBuilder(input_data)
-        builder.create_variables()
+        builder = _built(input_data)
         add_room_assignment_constraints(builder)
         builder._add_valid_time_slots_constraint()
 
-        solution = builder.solve(time_limit_seconds=10)
+        solution = builder.solve(time_limit_seconds=SOLVE_LIMIT, num_search_workers=1)
 
         assert solution.status == SolverStatus.INFEASIBLE
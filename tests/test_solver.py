@@ -11,11 +11,14 @@ Test Categories:
 from __future__ import annotations
 
 import json
+import os
 import tempfile
+from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
 import pytest
+from pydantic import ValidationError
 
 from solver.data.models import (
     TimetableInput,
@@ -56,15 +59,26 @@ from solver.output.metrics import (
     calculate_all_metrics,
     generate_report,
 )
+from tests._factories import assert_no_double_booking, make_input, period_grid
+
+
+# Multiplier for the solve budgets below, e.g. 0.5 on fast CI runners or 3
+# on slow machines where the generated schools otherwise time out and skip.
+TIME_LIMIT_SCALE = float(os.environ.get("TT_TEST_TIME_LIMIT_SCALE", "1"))
+
+
+def _time_limit(seconds: int) -> int:
+    """Scale a solve budget by TT_TEST_TIME_LIMIT_SCALE, never below one second."""
+    return max(1, round(seconds * TIME_LIMIT_SCALE))
 
 
 # =============================================================================
 # Fixtures - Sample Data
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def minimal_input() -> TimetableInput:
-    """Create minimal valid TimetableInput for testing."""
+    """Create minimal valid TimetableInput for testing (shared; do not mutate)."""
     return TimetableInput(
         config=SchoolConfig(
             school_name="Test School",
@@ -95,32 +109,81 @@ def minimal_input() -> TimetableInput:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def small_school_input() -> TimetableInput:
-    """Generate a small school for testing."""
+    """Generate a small school for testing (shared; do not mutate)."""
     return generate_small_school(seed=42)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def medium_school_input() -> TimetableInput:
-    """Generate a medium school for testing."""
+    """Generate a medium school for testing (shared; do not mutate)."""
     return generate_medium_school(seed=42)
 
 
-@pytest.fixture
-def multi_teacher_input() -> TimetableInput:
-    """Create input with multiple teachers for constraint testing."""
-    periods = []
-    for day in range(5):
-        for p in range(4):
-            periods.append(Period(
-                id=f"d{day}p{p}",
-                name=f"Day {day} Period {p+1}",
-                day=day,
-                start_minutes=540 + p * 60,
-                end_minutes=600 + p * 60,
-            ))
+@pytest.fixture(scope="module")
+def minimal_solution(minimal_input) -> SolverSolution:
+    """Solve the minimal school once for the tests that only inspect the result."""
+    return TimetableModelBuilder(minimal_input).solve(time_limit_seconds=_time_limit(30))
+
+
+@pytest.fixture(scope="module")
+def minimal_output(minimal_solution) -> TimetableOutput:
+    """Output built from minimal_solution, for the output format checks."""
+    if not minimal_solution.is_feasible:
+        pytest.skip("Could not find solution in time")
+    return create_timetable_output(minimal_solution)
+
+
+@pytest.fixture(scope="module")
+def minimal_json_data(minimal_solution) -> dict[str, Any]:
+    """solution_to_json(minimal_solution), parsed once (shared; do not mutate)."""
+    return json.loads(solution_to_json(minimal_solution))
+
+
+@pytest.fixture(scope="module")
+def multi_teacher_solution(multi_teacher_input) -> SolverSolution:
+    """Solve multi_teacher_input once for the constraint, view and requirement checks."""
+    return TimetableModelBuilder(multi_teacher_input).solve(time_limit_seconds=_time_limit(60))
+
 
+@pytest.fixture(scope="module")
+def multi_teacher_output(multi_teacher_solution) -> TimetableOutput:
+    """Output built from multi_teacher_solution, for the view checks."""
+    if not multi_teacher_solution.is_feasible:
+        pytest.skip("Could not find solution in time")
+    return create_timetable_output(multi_teacher_solution)
+
+
+@pytest.fixture(scope="module")
+def small_school_solution(small_school_input) -> SolverSolution:
+    """Solve the small school once for the tests that only inspect the result."""
+    return TimetableModelBuilder(small_school_input).solve(time_limit_seconds=_time_limit(60))
+
+
+@pytest.fixture(scope="module")
+def small_school_output(small_school_solution) -> TimetableOutput:
+    """Output built from small_school_solution, for the metrics checks."""
+    if not small_school_solution.is_feasible:
+        pytest.skip("Could not find solution in time")
+    return create_timetable_output(small_school_solution)
+
+
+@pytest.fixture(scope="module")
+def small_school_metrics(small_school_output, small_school_input) -> MetricsReport:
+    """calculate_all_metrics for the small school, computed once (shared; do not mutate)."""
+    return calculate_all_metrics(small_school_output, small_school_input)
+
+
+@pytest.fixture(scope="module")
+def medium_school_solution(medium_school_input) -> SolverSolution:
+    """Solve the medium school once for the tests that only inspect the result."""
+    return TimetableModelBuilder(medium_school_input).solve(time_limit_seconds=_time_limit(120))
+
+
+@pytest.fixture(scope="module")
+def multi_teacher_input() -> TimetableInput:
+    """Create input with multiple teachers for constraint testing (shared; do not mutate)."""
     return TimetableInput(
         config=SchoolConfig(school_name="Multi Teacher School", num_days=5),
         teachers=[
@@ -156,24 +219,13 @@ def multi_teacher_input() -> TimetableInput:
             Lesson(id="l6", teacher_id="t3", class_id="c2", subject_id="sci", lessons_per_week=2),
             Lesson(id="l7", teacher_id="t3", class_id="c1", subject_id="geo", lessons_per_week=2),
         ],
-        periods=periods,
+        periods=period_grid(5, 4),
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def teacher_unavailable_input() -> TimetableInput:
-    """Create input with teacher unavailability."""
-    periods = []
-    for day in range(3):
-        for p in range(3):
-            periods.append(Period(
-                id=f"d{day}p{p}",
-                name=f"Day {day} Period {p+1}",
-                day=day,
-                start_minutes=540 + p * 60,
-                end_minutes=600 + p * 60,
-            ))
-
+    """Create input with teacher unavailability (shared; do not mutate)."""
     return TimetableInput(
         config=SchoolConfig(school_name="Unavailability Test", num_days=3),
         teachers=[
@@ -199,24 +251,13 @@ def teacher_unavailable_input() -> TimetableInput:
         lessons=[
             Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=2),
         ],
-        periods=periods,
+        periods=period_grid(3, 3),
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def specialist_room_input() -> TimetableInput:
-    """Create input with specialist room requirements."""
-    periods = []
-    for day in range(5):
-        for p in range(4):
-            periods.append(Period(
-                id=f"d{day}p{p}",
-                name=f"Day {day} Period {p+1}",
-                day=day,
-                start_minutes=540 + p * 60,
-                end_minutes=600 + p * 60,
-            ))
-
+    """Create input with specialist room requirements (shared; do not mutate)."""
     return TimetableInput(
         config=SchoolConfig(school_name="Specialist Room Test", num_days=5),
         teachers=[
@@ -241,13 +282,27 @@ def specialist_room_input() -> TimetableInput:
             Lesson(id="l2", teacher_id="t1", class_id="c1", subject_id="sci", lessons_per_week=2),
             Lesson(id="l3", teacher_id="t2", class_id="c1", subject_id="pe", lessons_per_week=2),
         ],
-        periods=periods,
+        periods=period_grid(5, 4),
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def specialist_room_assignments(specialist_room_input) -> dict[str, list[LessonAssignment]]:
+    """Solve specialist_room_input once and index its assignments by lesson id."""
+    solution = TimetableModelBuilder(specialist_room_input).solve(time_limit_seconds=_time_limit(30))
+
+    if not solution.is_feasible:
+        pytest.skip("Could not find solution in time")
+
+    by_lesson: dict[str, list[LessonAssignment]] = defaultdict(list)
+    for a in solution.assignments:
+        by_lesson[a.lesson_id].append(a)
+    return by_lesson
+
+
+@pytest.fixture(scope="module")
 def json_input_data() -> dict:
-    """Create valid JSON input data dictionary."""
+    """Create valid JSON input data dictionary (shared; deep-copy before mutating)."""
     return {
         "teachers": [
             {"id": "t1", "name": "Mr Smith", "subjects": ["mat"]},
@@ -267,6 +322,18 @@ def json_input_data() -> dict:
     }
 
 
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def _schedulable_slots(input_data: TimetableInput) -> frozenset[tuple[int, int]]:
+    """(day, start_minutes) of every period a lesson may start in."""
+    return frozenset(
+        (period.day, period.start_minutes)
+        for period in input_data.get_schedulable_periods()
+    )
+
+
 # =============================================================================
 # 1. Data Loading Tests
 # =============================================================================
@@ -292,9 +359,9 @@ class TestLoadValidInput:
         assert len(minimal_input.teachers) == 1
         assert len(minimal_input.lessons) == 1
 
-    def test_generated_data_is_valid(self):
+    def test_generated_data_is_valid(self, small_school_input):
         """Generated school data passes validation."""
-        school = generate_small_school(seed=42)
+        school = small_school_input
 
         assert isinstance(school, TimetableInput)
         assert len(school.teachers) > 0
@@ -326,7 +393,7 @@ class TestRejectInvalidInput:
 
     def test_reject_invalid_entity_structure(self):
         """Reject malformed entity data."""
-        with pytest.raises(Exception):  # Pydantic validation error
+        with pytest.raises(ValidationError):
             TimetableInput(
                 teachers="not a list",  # Invalid
                 classes=[],
@@ -339,16 +406,11 @@ class TestRejectInvalidInput:
     def test_reject_duplicate_ids(self):
         """Reject duplicate entity IDs."""
         with pytest.raises(ValueError, match="Duplicate"):
-            TimetableInput(
+            make_input(
                 teachers=[
                     Teacher(id="t1", name="Mr Smith"),
                     Teacher(id="t1", name="Ms Jones"),  # Duplicate
                 ],
-                classes=[StudentClass(id="c1", name="Year 10A")],
-                subjects=[Subject(id="mat", name="Maths")],
-                rooms=[Room(id="r1", name="Room 101", type=RoomType.CLASSROOM)],
-                lessons=[Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=1)],
-                periods=[Period(id="p1", name="P1", day=0, start_minutes=540, end_minutes=600)],
             )
 
 
@@ -358,57 +420,35 @@ class TestValidateReferences:
     def test_reject_unknown_teacher_reference(self):
         """Reject lesson referencing unknown teacher."""
         with pytest.raises(ValueError, match="unknown teacher_id"):
-            TimetableInput(
-                teachers=[Teacher(id="t1", name="Mr Smith")],
-                classes=[StudentClass(id="c1", name="Year 10A")],
-                subjects=[Subject(id="mat", name="Maths")],
-                rooms=[Room(id="r1", name="Room 101", type=RoomType.CLASSROOM)],
+            make_input(
                 lessons=[
                     Lesson(id="l1", teacher_id="unknown", class_id="c1", subject_id="mat", lessons_per_week=1),
                 ],
-                periods=[Period(id="p1", name="P1", day=0, start_minutes=540, end_minutes=600)],
             )
 
     def test_reject_unknown_class_reference(self):
         """Reject lesson referencing unknown class."""
         with pytest.raises(ValueError, match="unknown class_id"):
-            TimetableInput(
-                teachers=[Teacher(id="t1", name="Mr Smith")],
-                classes=[StudentClass(id="c1", name="Year 10A")],
-                subjects=[Subject(id="mat", name="Maths")],
-                rooms=[Room(id="r1", name="Room 101", type=RoomType.CLASSROOM)],
+            make_input(
                 lessons=[
                     Lesson(id="l1", teacher_id="t1", class_id="unknown", subject_id="mat", lessons_per_week=1),
                 ],
-                periods=[Period(id="p1", name="P1", day=0, start_minutes=540, end_minutes=600)],
             )
 
     def test_reject_unknown_subject_reference(self):
         """Reject lesson referencing unknown subject."""
         with pytest.raises(ValueError, match="unknown subject_id"):
-            TimetableInput(
-                teachers=[Teacher(id="t1", name="Mr Smith")],
-                classes=[StudentClass(id="c1", name="Year 10A")],
-                subjects=[Subject(id="mat", name="Maths")],
-                rooms=[Room(id="r1", name="Room 101", type=RoomType.CLASSROOM)],
+            make_input(
                 lessons=[
                     Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="unknown", lessons_per_week=1),
                 ],
-                periods=[Period(id="p1", name="P1", day=0, start_minutes=540, end_minutes=600)],
             )
 
     def test_validate_teacher_subject_references(self):
         """Reject teacher referencing unknown subject."""
         with pytest.raises(ValueError, match="unknown subject"):
-            TimetableInput(
+            make_input(
                 teachers=[Teacher(id="t1", name="Mr Smith", subjects=["unknown"])],
-                classes=[StudentClass(id="c1", name="Year 10A")],
-                subjects=[Subject(id="mat", name="Maths")],
-                rooms=[Room(id="r1", name="Room 101", type=RoomType.CLASSROOM)],
-                lessons=[
-                    Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=1),
-                ],
-                periods=[Period(id="p1", name="P1", day=0, start_minutes=540, end_minutes=600)],
             )
 
     def test_valid_references_pass(self, minimal_input):
@@ -426,61 +466,27 @@ class TestValidateReferences:
 class TestNoTeacherDoubleBooking:
     """Tests for teacher no-overlap constraint."""
 
-    def test_teacher_not_double_booked(self, multi_teacher_input):
+    def test_teacher_not_double_booked(self, multi_teacher_solution):
         """Teacher cannot teach two classes at the same time."""
-        builder = TimetableModelBuilder(multi_teacher_input)
-        solution = builder.solve(time_limit_seconds=30)
+        solution = multi_teacher_solution
 
         if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
             pytest.skip("Could not find solution in time")
 
-        # Group assignments by teacher and check for overlaps
-        for teacher in multi_teacher_input.teachers:
-            teacher_assignments = [
-                a for a in solution.assignments if a.teacher_id == teacher.id
-            ]
-
-            # Check each pair for time overlap on same day
-            for i, a1 in enumerate(teacher_assignments):
-                for a2 in teacher_assignments[i+1:]:
-                    if a1.day == a2.day:
-                        # Check for overlap
-                        overlaps = not (a1.end_minutes <= a2.start_minutes or
-                                       a2.end_minutes <= a1.start_minutes)
-                        assert not overlaps, (
-                            f"Teacher {teacher.id} double-booked: "
-                            f"Day {a1.day}, {a1.start_minutes}-{a1.end_minutes} and "
-                            f"{a2.start_minutes}-{a2.end_minutes}"
-                        )
+        assert_no_double_booking(solution.assignments, "teacher_id", "Teacher")
 
 
 class TestNoClassDoubleBooking:
     """Tests for class no-overlap constraint."""
 
-    def test_class_not_double_booked(self, multi_teacher_input):
+    def test_class_not_double_booked(self, multi_teacher_solution):
         """Class cannot have two lessons at the same time."""
-        builder = TimetableModelBuilder(multi_teacher_input)
-        solution = builder.solve(time_limit_seconds=30)
+        solution = multi_teacher_solution
 
         if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
             pytest.skip("Could not find solution in time")
 
-        # Group assignments by class and check for overlaps
-        for cls in multi_teacher_input.classes:
-            class_assignments = [
-                a for a in solution.assignments if a.class_id == cls.id
-            ]
-
-            for i, a1 in enumerate(class_assignments):
-                for a2 in class_assignments[i+1:]:
-                    if a1.day == a2.day:
-                        overlaps = not (a1.end_minutes <= a2.start_minutes or
-                                       a2.end_minutes <= a1.start_minutes)
-                        assert not overlaps, (
-                            f"Class {cls.id} double-booked: "
-                            f"Day {a1.day}, {a1.start_minutes}-{a1.end_minutes} and "
-                            f"{a2.start_minutes}-{a2.end_minutes}"
-                        )
+        assert_no_double_booking(solution.assignments, "class_id", "Class")
 
 
 class TestTeacherUnavailabilityRespected:
@@ -489,76 +495,54 @@ class TestTeacherUnavailabilityRespected:
     def test_respects_teacher_unavailability(self, teacher_unavailable_input):
         """Lessons not scheduled during teacher unavailability."""
         builder = TimetableModelBuilder(teacher_unavailable_input)
-        solution = builder.solve(time_limit_seconds=30)
+        solution = builder.solve(time_limit_seconds=_time_limit(30))
 
         if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
             pytest.skip("Could not find solution in time")
 
-        # Teacher is unavailable day 0, 540-600
+        # Unavailable windows per (teacher, day), read from the input
+        # (t1 is unavailable day 0, 540-600)
+        blocked: dict[tuple[str, int], list[tuple[int, int]]] = defaultdict(list)
+        for teacher in teacher_unavailable_input.teachers:
+            for window in teacher.availability:
+                if not window.available:
+                    blocked[teacher.id, window.day].append(
+                        (window.start_minutes, window.end_minutes)
+                    )
+        assert blocked, "fixture should mark some time unavailable"
+
         for assignment in solution.assignments:
-            if assignment.teacher_id == "t1" and assignment.day == 0:
-                # Should not overlap with 540-600
-                overlaps = not (assignment.end_minutes <= 540 or
-                               assignment.start_minutes >= 600)
+            for start, end in blocked.get((assignment.teacher_id, assignment.day), ()):
+                overlaps = assignment.start_minutes < end and start < assignment.end_minutes
                 assert not overlaps, (
-                    f"Teacher t1 scheduled during unavailability: "
-                    f"Day 0, {assignment.start_minutes}-{assignment.end_minutes}"
+                    f"Teacher {assignment.teacher_id} scheduled during unavailability: "
+                    f"Day {assignment.day}, {assignment.start_minutes}-{assignment.end_minutes}"
                 )
 
 
 class TestRoomSuitabilityEnforced:
     """Tests for room type constraint."""
 
-    def test_science_in_science_lab(self, specialist_room_input):
+    def test_science_in_science_lab(self, specialist_room_assignments):
         """Science lessons must be in science lab."""
-        builder = TimetableModelBuilder(specialist_room_input)
-        solution = builder.solve(time_limit_seconds=30)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
-            pytest.skip("Could not find solution in time")
-
-        # Find science lessons (l2)
-        science_assignments = [
-            a for a in solution.assignments if a.lesson_id == "l2"
-        ]
-
-        for assignment in science_assignments:
+        # Science lessons are l2
+        for assignment in specialist_room_assignments["l2"]:
             assert assignment.room_id == "lab1", (
                 f"Science lesson in wrong room: {assignment.room_id}, expected lab1"
             )
 
-    def test_pe_in_gym(self, specialist_room_input):
+    def test_pe_in_gym(self, specialist_room_assignments):
         """PE lessons must be in gym."""
-        builder = TimetableModelBuilder(specialist_room_input)
-        solution = builder.solve(time_limit_seconds=30)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
-            pytest.skip("Could not find solution in time")
-
-        # Find PE lessons (l3)
-        pe_assignments = [
-            a for a in solution.assignments if a.lesson_id == "l3"
-        ]
-
-        for assignment in pe_assignments:
+        # PE lessons are l3
+        for assignment in specialist_room_assignments["l3"]:
             assert assignment.room_id == "gym1", (
                 f"PE lesson in wrong room: {assignment.room_id}, expected gym1"
             )
 
-    def test_regular_lessons_in_classroom(self, specialist_room_input):
+    def test_regular_lessons_in_classroom(self, specialist_room_input, specialist_room_assignments):
         """Regular lessons can be in any classroom."""
-        builder = TimetableModelBuilder(specialist_room_input)
-        solution = builder.solve(time_limit_seconds=30)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
-            pytest.skip("Could not find solution in time")
-
         # Math lessons (l1) should be in regular classroom
-        math_assignments = [
-            a for a in solution.assignments if a.lesson_id == "l1"
-        ]
-
-        for assignment in math_assignments:
+        for assignment in specialist_room_assignments["l1"]:
             # Can be in any room that's a classroom (r1 is the only classroom)
             room = specialist_room_input.get_room(assignment.room_id)
             assert room is not None
@@ -570,15 +554,13 @@ class TestSchoolDayBounds:
     def test_lessons_within_school_hours(self, minimal_input):
         """Lessons scheduled within defined periods."""
         builder = TimetableModelBuilder(minimal_input)
-        solution = builder.solve(time_limit_seconds=30)
+        solution = builder.solve(time_limit_seconds=_time_limit(30))
 
         if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
             pytest.skip("Could not find solution in time")
 
         # Get valid period times
-        valid_slots = set()
-        for period in minimal_input.get_schedulable_periods():
-            valid_slots.add((period.day, period.start_minutes))
+        valid_slots = _schedulable_slots(minimal_input)
 
         for assignment in solution.assignments:
             slot = (assignment.day, assignment.start_minutes)
@@ -591,30 +573,14 @@ class TestSchoolDayBounds:
 class TestNoRoomDoubleBooking:
     """Tests for room no-overlap constraint."""
 
-    def test_room_not_double_booked(self, multi_teacher_input):
+    def test_room_not_double_booked(self, multi_teacher_solution):
         """Room cannot host two lessons at the same time."""
-        builder = TimetableModelBuilder(multi_teacher_input)
-        solution = builder.solve(time_limit_seconds=30)
+        solution = multi_teacher_solution
 
         if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
             pytest.skip("Could not find solution in time")
 
-        # Group assignments by room and check for overlaps
-        for room in multi_teacher_input.rooms:
-            room_assignments = [
-                a for a in solution.assignments if a.room_id == room.id
-            ]
-
-            for i, a1 in enumerate(room_assignments):
-                for a2 in room_assignments[i+1:]:
-                    if a1.day == a2.day:
-                        overlaps = not (a1.end_minutes <= a2.start_minutes or
-                                       a2.end_minutes <= a1.start_minutes)
-                        assert not overlaps, (
-                            f"Room {room.id} double-booked: "
-                            f"Day {a1.day}, {a1.start_minutes}-{a1.end_minutes} and "
-                            f"{a2.start_minutes}-{a2.end_minutes}"
-                        )
+        assert_no_double_booking(solution.assignments, "room_id", "Room")
 
 
 # =============================================================================
@@ -627,7 +593,7 @@ class TestSmallSchoolSolvable:
     def test_minimal_school_solvable(self, minimal_input):
         """Minimal school configuration is solvable."""
         builder = TimetableModelBuilder(minimal_input)
-        solution = builder.solve(time_limit_seconds=30)
+        solution = builder.solve(time_limit_seconds=_time_limit(30))
 
         assert solution.status in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE)
         assert len(solution.assignments) == 2  # 2 lessons per week
@@ -635,7 +601,7 @@ class TestSmallSchoolSolvable:
     def test_small_school_solvable(self, small_school_input):
         """Small generated school is solvable."""
         builder = TimetableModelBuilder(small_school_input)
-        solution = builder.solve(time_limit_seconds=120)
+        solution = builder.solve(time_limit_seconds=_time_limit(120))
 
         # May timeout on slow machines, so we skip rather than fail
         if solution.status == SolverStatus.UNKNOWN:
@@ -648,10 +614,9 @@ class TestSmallSchoolSolvable:
 class TestSolutionIsValid:
     """Tests for solution validity."""
 
-    def test_all_lessons_scheduled(self, minimal_input):
+    def test_all_lessons_scheduled(self, minimal_input, minimal_solution):
         """All required lessons are scheduled."""
-        builder = TimetableModelBuilder(minimal_input)
-        solution = builder.solve(time_limit_seconds=30)
+        solution = minimal_solution
 
         if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
             pytest.skip("Could not find solution in time")
@@ -660,10 +625,9 @@ class TestSolutionIsValid:
         expected_instances = sum(l.lessons_per_week for l in minimal_input.lessons)
         assert len(solution.assignments) == expected_instances
 
-    def test_assignments_have_required_fields(self, minimal_input):
+    def test_assignments_have_required_fields(self, minimal_solution):
         """Each assignment has all required fields."""
-        builder = TimetableModelBuilder(minimal_input)
-        solution = builder.solve(time_limit_seconds=30)
+        solution = minimal_solution
 
         if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
             pytest.skip("Could not find solution in time")
@@ -678,22 +642,18 @@ class TestSolutionIsValid:
             assert assignment.teacher_id is not None
             assert assignment.class_id is not None
 
-    def test_solution_references_valid_entities(self, minimal_input):
+    def test_solution_references_valid_entities(self, minimal_input, minimal_solution):
         """Solution references valid teachers, classes, rooms."""
-        builder = TimetableModelBuilder(minimal_input)
-        solution = builder.solve(time_limit_seconds=30)
+        solution = minimal_solution
 
         if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
             pytest.skip("Could not find solution in time")
 
-        teacher_ids = {t.id for t in minimal_input.teachers}
-        class_ids = {c.id for c in minimal_input.classes}
-        room_ids = {r.id for r in minimal_input.rooms}
-
+        # The input's id lookup maps are built once at validation time.
         for assignment in solution.assignments:
-            assert assignment.teacher_id in teacher_ids
-            assert assignment.class_id in class_ids
-            assert assignment.room_id in room_ids
+            assert minimal_input.get_teacher(assignment.teacher_id) is not None
+            assert minimal_input.get_class(assignment.class_id) is not None
+            assert minimal_input.get_room(assignment.room_id) is not None
 
 
 class TestTimeoutHandling:
@@ -729,25 +689,31 @@ class TestInfeasibleDetection:
     """Tests for detecting infeasible problems."""
 
     def test_detects_too_many_lessons(self):
-        """Detects when there are more lessons than slots."""
-        # Only 2 slots but 3 lessons for same teacher
+        """Detects when a class has more lessons than slots."""
+        # Only 3 slots but 4 lessons for the same class. Each teacher fits on
+        # their own, so input validation passes and the solver must prove it.
         input_data = TimetableInput(
             config=SchoolConfig(school_name="Infeasible Test", num_days=1),
-            teachers=[Teacher(id="t1", name="Mr Smith")],
+            teachers=[Teacher(id="t1", name="Mr Smith"), Teacher(id="t2", name="Ms Jones")],
             classes=[StudentClass(id="c1", name="Year 10A")],
-            subjects=[Subject(id="mat", name="Maths")],
-            rooms=[Room(id="r1", name="Room 101", type=RoomType.CLASSROOM)],
+            subjects=[Subject(id="mat", name="Maths"), Subject(id="eng", name="English")],
+            rooms=[
+                Room(id="r1", name="Room 101", type=RoomType.CLASSROOM),
+                Room(id="r2", name="Room 102", type=RoomType.CLASSROOM),
+            ],
             lessons=[
-                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=3),
+                Lesson(id="l1", teacher_id="t1", class_id="c1", subject_id="mat", lessons_per_week=2),
+                Lesson(id="l2", teacher_id="t2", class_id="c1", subject_id="eng", lessons_per_week=2),
             ],
             periods=[
                 Period(id="p1", name="P1", day=0, start_minutes=540, end_minutes=600),
                 Period(id="p2", name="P2", day=0, start_minutes=600, end_minutes=660),
+                Period(id="p3", name="P3", day=0, start_minutes=660, end_minutes=720),
             ],
         )
 
         builder = TimetableModelBuilder(input_data)
-        solution = builder.solve(time_limit_seconds=10)
+        solution = builder.solve(time_limit_seconds=_time_limit(10))
 
         assert solution.status == SolverStatus.INFEASIBLE
 
@@ -781,58 +747,37 @@ class TestInfeasibleDetection:
 class TestOutputFormatValid:
     """Tests for output format validity."""
 
-    def test_creates_valid_output(self, minimal_input):
+    def test_creates_valid_output(self, minimal_output):
         """Creates valid TimetableOutput from solution."""
-        builder = TimetableModelBuilder(minimal_input)
-        solution = builder.solve(time_limit_seconds=30)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
-            pytest.skip("Could not find solution in time")
-
-        output = create_timetable_output(solution)
+        output = minimal_output
 
         assert isinstance(output, TimetableOutput)
         assert output.status in (OutputStatus.OPTIMAL, OutputStatus.FEASIBLE)
 
-    def test_output_has_all_lessons(self, minimal_input):
+    def test_output_has_all_lessons(self, minimal_input, minimal_output):
         """Output contains all scheduled lessons."""
-        builder = TimetableModelBuilder(minimal_input)
-        solution = builder.solve(time_limit_seconds=30)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
-            pytest.skip("Could not find solution in time")
-
-        output = create_timetable_output(solution)
+        output = minimal_output
 
         expected_count = sum(l.lessons_per_week for l in minimal_input.lessons)
         assert len(output.timetable.lessons) == expected_count
 
-    def test_output_serializes_to_json(self, minimal_input):
+    def test_output_serializes_to_json(self, minimal_solution, minimal_json_data):
         """Output can be serialized to valid JSON."""
-        builder = TimetableModelBuilder(minimal_input)
-        solution = builder.solve(time_limit_seconds=30)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
+        if not minimal_solution.is_feasible:
             pytest.skip("Could not find solution in time")
 
-        json_str = solution_to_json(solution)
-
         # Should be valid JSON
-        data = json.loads(json_str)
+        data = minimal_json_data
         assert "status" in data
         assert "timetable" in data
         assert "lessons" in data["timetable"]
 
-    def test_json_uses_camel_case(self, minimal_input):
+    def test_json_uses_camel_case(self, minimal_solution, minimal_json_data):
         """JSON output uses camelCase keys."""
-        builder = TimetableModelBuilder(minimal_input)
-        solution = builder.solve(time_limit_seconds=30)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
+        if not minimal_solution.is_feasible:
             pytest.skip("Could not find solution in time")
 
-        json_str = solution_to_json(solution)
-        data = json.loads(json_str)
+        data = minimal_json_data
 
         assert "solveTimeSeconds" in data
         assert "softConstraintScores" in data["quality"]
@@ -846,148 +791,79 @@ class TestOutputFormatValid:
 class TestViewsCorrect:
     """Tests for pre-computed views."""
 
-    def test_views_by_teacher(self, multi_teacher_input):
+    def test_views_by_teacher(self, multi_teacher_output):
         """byTeacher view groups lessons correctly."""
-        builder = TimetableModelBuilder(multi_teacher_input)
-        solution = builder.solve(time_limit_seconds=60)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
-            pytest.skip("Could not find solution in time")
-
-        output = create_timetable_output(solution)
+        output = multi_teacher_output
 
         # Each teacher should have their lessons grouped
         for teacher_id, schedule in output.views.by_teacher.items():
-            for lesson in schedule.lessons:
-                assert lesson.teacher_id == teacher_id
+            assert all(lesson.teacher_id == teacher_id for lesson in schedule.lessons), teacher_id
 
-    def test_views_by_class(self, multi_teacher_input):
+    def test_views_by_class(self, multi_teacher_output):
         """byClass view groups lessons correctly."""
-        builder = TimetableModelBuilder(multi_teacher_input)
-        solution = builder.solve(time_limit_seconds=60)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
-            pytest.skip("Could not find solution in time")
-
-        output = create_timetable_output(solution)
+        output = multi_teacher_output
 
         for class_id, schedule in output.views.by_class.items():
-            for lesson in schedule.lessons:
-                assert lesson.class_id == class_id
+            assert all(lesson.class_id == class_id for lesson in schedule.lessons), class_id
 
-    def test_views_by_room(self, multi_teacher_input):
+    def test_views_by_room(self, multi_teacher_output):
         """byRoom view groups lessons correctly."""
-        builder = TimetableModelBuilder(multi_teacher_input)
-        solution = builder.solve(time_limit_seconds=60)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
-            pytest.skip("Could not find solution in time")
-
-        output = create_timetable_output(solution)
+        output = multi_teacher_output
 
         for room_id, schedule in output.views.by_room.items():
-            for lesson in schedule.lessons:
-                assert lesson.room_id == room_id
+            assert all(lesson.room_id == room_id for lesson in schedule.lessons), room_id
 
-    def test_views_by_day(self, multi_teacher_input):
+    def test_views_by_day(self, multi_teacher_output):
         """byDay view groups lessons correctly."""
-        builder = TimetableModelBuilder(multi_teacher_input)
-        solution = builder.solve(time_limit_seconds=60)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
-            pytest.skip("Could not find solution in time")
-
-        output = create_timetable_output(solution)
+        output = multi_teacher_output
 
         for day, schedule in output.views.by_day.items():
-            for lesson in schedule.lessons:
-                assert lesson.day == day
+            assert all(lesson.day == day for lesson in schedule.lessons), day
 
-    def test_views_sorted_by_time(self, multi_teacher_input):
+    def test_views_sorted_by_time(self, multi_teacher_output):
         """Lessons within views are sorted by time."""
-        builder = TimetableModelBuilder(multi_teacher_input)
-        solution = builder.solve(time_limit_seconds=60)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
-            pytest.skip("Could not find solution in time")
-
-        output = create_timetable_output(solution)
+        output = multi_teacher_output
 
         for teacher_id, schedule in output.views.by_teacher.items():
-            for i in range(len(schedule.lessons) - 1):
-                l1, l2 = schedule.lessons[i], schedule.lessons[i+1]
-                assert (l1.day, l1.start_time) <= (l2.day, l2.start_time)
+            keys = [(lesson.day, lesson.start_time) for lesson in schedule.lessons]
+            assert all(a <= b for a, b in zip(keys, keys[1:])), teacher_id
 
 
+@pytest.mark.xdist_group(name="solver_small_school")
 class TestMetricsCalculated:
     """Tests for quality metrics calculation."""
 
-    def test_calculates_gap_metrics(self, small_school_input):
+    def test_calculates_gap_metrics(self, small_school_metrics):
         """Gap metrics are calculated."""
-        builder = TimetableModelBuilder(small_school_input)
-        solution = builder.solve(time_limit_seconds=60)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
-            pytest.skip("Could not find solution in time")
-
-        output = create_timetable_output(solution)
-        metrics = calculate_all_metrics(output, small_school_input)
+        metrics = small_school_metrics
 
         assert metrics.gap_metrics is not None
         assert metrics.gap_metrics.average_gap_minutes >= 0
 
-    def test_calculates_distribution_metrics(self, small_school_input):
+    def test_calculates_distribution_metrics(self, small_school_metrics):
         """Distribution metrics are calculated."""
-        builder = TimetableModelBuilder(small_school_input)
-        solution = builder.solve(time_limit_seconds=60)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
-            pytest.skip("Could not find solution in time")
-
-        output = create_timetable_output(solution)
-        metrics = calculate_all_metrics(output, small_school_input)
+        metrics = small_school_metrics
 
         assert metrics.distribution_metrics is not None
         assert 0 <= metrics.distribution_metrics.percentage_well_distributed <= 100
 
-    def test_calculates_balance_metrics(self, small_school_input):
+    def test_calculates_balance_metrics(self, small_school_metrics):
         """Balance metrics are calculated."""
-        builder = TimetableModelBuilder(small_school_input)
-        solution = builder.solve(time_limit_seconds=60)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
-            pytest.skip("Could not find solution in time")
-
-        output = create_timetable_output(solution)
-        metrics = calculate_all_metrics(output, small_school_input)
+        metrics = small_school_metrics
 
         assert metrics.balance_metrics is not None
         assert metrics.balance_metrics.average_std_dev >= 0
 
-    def test_calculates_overall_score(self, small_school_input):
+    def test_calculates_overall_score(self, small_school_metrics):
         """Overall score is calculated."""
-        builder = TimetableModelBuilder(small_school_input)
-        solution = builder.solve(time_limit_seconds=60)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
-            pytest.skip("Could not find solution in time")
-
-        output = create_timetable_output(solution)
-        metrics = calculate_all_metrics(output, small_school_input)
+        metrics = small_school_metrics
 
         assert 0 <= metrics.overall_score <= 100
         assert metrics.grade in ("A", "B", "C", "D", "F")
 
-    def test_generates_report(self, small_school_input):
+    def test_generates_report(self, small_school_input, small_school_output):
         """Human-readable report is generated."""
-        builder = TimetableModelBuilder(small_school_input)
-        solution = builder.solve(time_limit_seconds=60)
-
-        if solution.status not in (SolverStatus.OPTIMAL, SolverStatus.FEASIBLE):
-            pytest.skip("Could not find solution in time")
-
-        output = create_timetable_output(solution)
-        report = generate_report(output, small_school_input)
+        report = generate_report(small_school_output, small_school_input)
 
         assert isinstance(report, str)
         assert "TIMETABLE QUALITY REPORT" in report
@@ -998,17 +874,19 @@ class TestMetricsCalculated:
 # 5. Integration Tests
 # =============================================================================
 
+@pytest.mark.xdist_group(name="solver_small_school")
 class TestEndToEndSmall:
     """End-to-end tests with small school."""
 
-    def test_full_workflow_small(self, small_school_input):
+    def test_full_workflow_small(self, small_school_input, small_school_solution):
         """Complete workflow: load -> solve -> output -> metrics."""
         # Step 1: Input is already validated (from fixture)
         assert isinstance(small_school_input, TimetableInput)
 
-        # Step 2: Solve
+        # Step 2: Solve, warm-started from the shared solve of the same school
         builder = TimetableModelBuilder(small_school_input)
-        solution = builder.solve(time_limit_seconds=120)
+        builder.add_solution_hint(small_school_solution)
+        solution = builder.solve(time_limit_seconds=_time_limit(120))
 
         if solution.status == SolverStatus.UNKNOWN:
             pytest.skip("Solver timed out - may need more time on this machine")
@@ -1027,10 +905,9 @@ class TestEndToEndSmall:
         assert metrics.hard_constraints_satisfied
         assert metrics.overall_score > 0
 
-    def test_json_round_trip(self, small_school_input):
+    def test_json_round_trip(self, small_school_input, small_school_solution):
         """JSON serialization round-trip works."""
-        builder = TimetableModelBuilder(small_school_input)
-        solution = builder.solve(time_limit_seconds=60)
+        solution = small_school_solution
 
         if not solution.is_feasible:
             pytest.skip("Could not find solution")
@@ -1045,52 +922,25 @@ class TestEndToEndSmall:
         assert data["status"] in ("optimal", "feasible")
         assert len(data["timetable"]["lessons"]) == len(solution.assignments)
 
-    def test_all_constraints_verified(self, small_school_input):
+    def test_all_constraints_verified(self, small_school_input, small_school_solution):
         """All hard constraints are satisfied in solution."""
-        builder = TimetableModelBuilder(small_school_input)
-        solution = builder.solve(time_limit_seconds=60)
+        solution = small_school_solution
 
         if not solution.is_feasible:
             pytest.skip("Could not find solution")
 
-        # Verify no teacher double-booking
-        teacher_slots: dict[str, set[tuple[int, int]]] = {}
-        for a in solution.assignments:
-            key = a.teacher_id
-            slot = (a.day, a.start_minutes)
-            if key not in teacher_slots:
-                teacher_slots[key] = set()
-            assert slot not in teacher_slots[key], f"Teacher {key} double-booked"
-            teacher_slots[key].add(slot)
-
-        # Verify no class double-booking
-        class_slots: dict[str, set[tuple[int, int]]] = {}
-        for a in solution.assignments:
-            key = a.class_id
-            slot = (a.day, a.start_minutes)
-            if key not in class_slots:
-                class_slots[key] = set()
-            assert slot not in class_slots[key], f"Class {key} double-booked"
-            class_slots[key].add(slot)
-
-        # Verify no room double-booking
-        room_slots: dict[str, set[tuple[int, int]]] = {}
-        for a in solution.assignments:
-            key = a.room_id
-            slot = (a.day, a.start_minutes)
-            if key not in room_slots:
-                room_slots[key] = set()
-            assert slot not in room_slots[key], f"Room {key} double-booked"
-            room_slots[key].add(slot)
+        assert_no_double_booking(solution.assignments, "teacher_id", "Teacher")
+        assert_no_double_booking(solution.assignments, "class_id", "Class")
+        assert_no_double_booking(solution.assignments, "room_id", "Room")
 
 
+@pytest.mark.xdist_group(name="solver_medium_school")
 class TestEndToEndMedium:
     """End-to-end tests with medium school."""
 
-    def test_medium_school_solvable(self, medium_school_input):
+    def test_medium_school_solvable(self, medium_school_input, medium_school_solution):
         """Medium school can be solved."""
-        builder = TimetableModelBuilder(medium_school_input)
-        solution = builder.solve(time_limit_seconds=120)
+        solution = medium_school_solution
 
         # May timeout on slow machines
         if solution.status == SolverStatus.UNKNOWN:
@@ -1102,10 +952,9 @@ class TestEndToEndMedium:
             SolverStatus.FEASIBLE,
         ), f"Failed to solve medium school: {solution.status}"
 
-    def test_medium_school_quality_acceptable(self, medium_school_input):
+    def test_medium_school_quality_acceptable(self, medium_school_input, medium_school_solution):
         """Medium school solution has acceptable quality."""
-        builder = TimetableModelBuilder(medium_school_input)
-        solution = builder.solve(time_limit_seconds=120)
+        solution = medium_school_solution
 
         if not solution.is_feasible:
             pytest.skip("Could not find solution in time")
@@ -1190,7 +1039,7 @@ class TestCoreRequirements:
 
         # Attempt to solve
         builder = TimetableModelBuilder(school)
-        solution = builder.solve(time_limit_seconds=120)
+        solution = builder.solve(time_limit_seconds=_time_limit(120))
 
         # May timeout on slow machines
         if solution.status == SolverStatus.UNKNOWN:
@@ -1200,43 +1049,17 @@ class TestCoreRequirements:
         assert solution.is_feasible, f"Failed to solve 20/15 school: {solution.status}"
         assert len(solution.assignments) > 0
 
-    def test_all_hard_constraints_satisfied(self, multi_teacher_input):
+    def test_all_hard_constraints_satisfied(self, multi_teacher_input, multi_teacher_solution):
         """All 5 hard constraints satisfied (no double-booking)."""
-        builder = TimetableModelBuilder(multi_teacher_input)
-        solution = builder.solve(time_limit_seconds=60)
+        solution = multi_teacher_solution
 
         if not solution.is_feasible:
             pytest.skip("Could not find solution")
 
-        # 1. Teacher no double-booking
-        teacher_slots: dict[str, set[tuple[int, int]]] = {}
-        for a in solution.assignments:
-            slot = (a.day, a.start_minutes)
-            if a.teacher_id not in teacher_slots:
-                teacher_slots[a.teacher_id] = set()
-            assert slot not in teacher_slots[a.teacher_id], \
-                f"HARD CONSTRAINT VIOLATED: Teacher {a.teacher_id} double-booked at {slot}"
-            teacher_slots[a.teacher_id].add(slot)
-
-        # 2. Class no double-booking
-        class_slots: dict[str, set[tuple[int, int]]] = {}
-        for a in solution.assignments:
-            slot = (a.day, a.start_minutes)
-            if a.class_id not in class_slots:
-                class_slots[a.class_id] = set()
-            assert slot not in class_slots[a.class_id], \
-                f"HARD CONSTRAINT VIOLATED: Class {a.class_id} double-booked at {slot}"
-            class_slots[a.class_id].add(slot)
-
-        # 3. Room no double-booking
-        room_slots: dict[str, set[tuple[int, int]]] = {}
-        for a in solution.assignments:
-            slot = (a.day, a.start_minutes)
-            if a.room_id not in room_slots:
-                room_slots[a.room_id] = set()
-            assert slot not in room_slots[a.room_id], \
-                f"HARD CONSTRAINT VIOLATED: Room {a.room_id} double-booked at {slot}"
-            room_slots[a.room_id].add(slot)
+        # 1-3. Teacher, class and room no double-booking
+        assert_no_double_booking(solution.assignments, "teacher_id", "HARD CONSTRAINT VIOLATED: Teacher")
+        assert_no_double_booking(solution.assignments, "class_id", "HARD CONSTRAINT VIOLATED: Class")
+        assert_no_double_booking(solution.assignments, "room_id", "HARD CONSTRAINT VIOLATED: Room")
 
         # 4. Room type suitability (science in lab, etc.)
         for a in solution.assignments:
@@ -1248,9 +1071,7 @@ class TestCoreRequirements:
                     f"HARD CONSTRAINT VIOLATED: {subject.name} in wrong room type {room.type}"
 
         # 5. Lessons within valid time slots
-        valid_slots = set()
-        for period in multi_teacher_input.get_schedulable_periods():
-            valid_slots.add((period.day, period.start_minutes))
+        valid_slots = _schedulable_slots(multi_teacher_input)
         for a in solution.assignments:
             slot = (a.day, a.start_minutes)
             assert slot in valid_slots, \
@@ -1282,7 +1103,7 @@ class TestCoreRequirements:
     def test_solution_within_60_seconds(self, minimal_input):
         """Solution found within 60 seconds."""
         builder = TimetableModelBuilder(minimal_input)
-        solution = builder.solve(time_limit_seconds=60)
+        solution = builder.solve(time_limit_seconds=_time_limit(60))
 
         # Should find a solution
         assert solution.is_feasible, f"No solution found: {solution.status}"
@@ -1291,21 +1112,12 @@ class TestCoreRequirements:
         assert solution.solve_time_ms < 65000, \
             f"Solution took too long: {solution.solve_time_ms}ms"
 
-    def test_json_input_output_working(self, minimal_input, tmp_path):
+    def test_json_input_output_working(self, minimal_solution, minimal_json_data, tmp_path):
         """JSON input/output working correctly."""
-        # Solve to get a solution
-        builder = TimetableModelBuilder(minimal_input)
-        solution = builder.solve(time_limit_seconds=30)
-
-        assert solution.is_feasible
+        assert minimal_solution.is_feasible
 
-        # Test JSON output
-        json_str = solution_to_json(solution)
-        assert json_str is not None
-        assert len(json_str) > 0
-
-        # Verify it's valid JSON
-        data = json.loads(json_str)
+        # Test JSON output: the fixture parsed solution_to_json's string
+        data = minimal_json_data
         assert "status" in data
         assert "timetable" in data
         assert "lessons" in data["timetable"]